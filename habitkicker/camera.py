@@ -2,25 +2,42 @@
 
 import cv2
 import time
+import numpy as np
 import threading
-from PyQt6.QtCore import QTimer
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage
 from config.landmark_config import LandmarkConfig
 from detectors.habit_detector import HabitDetector
 from detectors.slouch_detector import SlouchDetector
 from utils.mediapipe_handler import MediapipeHandler
 from utils.screen_overlay import ScreenOverlay
 
-class Camera:
+class Camera(QObject):
+    # Emitted from the camera thread whenever a new display frame is available
+    frame_ready = pyqtSignal()
+    # Emitted from the camera thread with (progress, message) while calibrating, and once calibration ends
+    calibration_progress = pyqtSignal(int, str)
+    calibration_done = pyqtSignal(bool)
+
     def __init__(self, max_nail_pulling_distance, max_hair_pulling_distance, slouch_threshold, gui_window):
-        self.mp_handler = MediapipeHandler()
+        super().__init__()
+        self.mp_handler = MediapipeHandler()  # Created once; its solutions track landmarks across frames
+        # Runs pose alongside hands and face mesh; MediaPipe releases the GIL while a graph runs
+        self._inference_pool = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "mediapipe")
         self.habit_detector = HabitDetector(max_nail_pulling_distance, max_hair_pulling_distance)
         self.slouch_detector = SlouchDetector(threshold_percentage = slouch_threshold)
         self.config = LandmarkConfig()
         self.screen_overlay = ScreenOverlay()
         self.cap = None
+        self._rgb_frame = None  # RGB copy of the current frame for MediaPipe, reused across frames
+        self._inference_width = 640  # Frames wider than this are downscaled before inference
         self.is_calibrating = False
         self.calibration_complete_time = 0  # Track when calibration completed
+        self._last_calibration_progress = None  # Last (progress, message) emitted to the GUI
         self.processing_delay = 0.5  # Default 2 FPS
+        self.stored_processing_delay = None  # Processing delay to restore after calibration, if one is running
         
         # Detection toggles - disabled by default
         self.enable_nail_detection = False
@@ -41,130 +58,121 @@ class Camera:
         self._yellow = (0, 255, 255)
         self._white = (255, 255, 255)
         
-        # Current frame for external access
-        self.current_frame = None
+        # Latest display frames for the GUI as (frame, QImage, frame_id), newest last
+        self.frame_id = 0  # Incremented every time a new frame is stored
+        self._display_frames = deque(maxlen = 2)
+        self._display_lock = threading.Lock()
+        self.display_enabled = False  # Whether the GUI is currently showing the camera feed
+        self.display_size = None  # (width, height) of the GUI camera view, frames are pre-scaled to fit
+        self._display_scale_key = None  # (frame shape, display size) the cached target size was computed for
+        self._display_target_size = None
         
         # Thread control
         self.running = False
         self.thread = None
+        self.capture_enabled = threading.Event()  # Cleared while paused; the thread waits on it instead of exiting
+        self._grabber = None  # Thread reading frames from self.cap
+        self._grabber_stop = threading.Event()  # Set to make the current grabber thread exit
+        self._frame_slot = None  # Newest (ret, frame) from the grabber thread (frame is None unless retrieved), None once taken
+        self._frame_lock = threading.Lock()  # Guards _frame_slot only; never held while reading the device
+        self._frame_grabbed = threading.Event()  # Set by the grabber thread whenever it has stored a new grab
+        self._retrieve_requested = threading.Event()  # Set by the camera thread when it needs the next frame decoded
 
         # Reference to GUI window
         self.gui_window = gui_window
 
     def _initialize_camera(self):
         """Initialize camera with specific settings"""
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 854)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 1)
-        self.cap.set(cv2.CAP_PROP_BRIGHTNESS, 150)
-        self.cap.set(cv2.CAP_PROP_CONTRAST, 150)
+        cap = cv2.VideoCapture(0)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 854)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_AUTOFOCUS, 1)
+        cap.set(cv2.CAP_PROP_BRIGHTNESS, 150)
+        cap.set(cv2.CAP_PROP_CONTRAST, 150)
+        self.cap = cap
+        
+        # Read frames on a separate thread so reading the device overlaps with processing
+        with self._frame_lock:
+            self._frame_slot = None
+        self._frame_grabbed.clear()
+        self._grabber_stop = threading.Event()
+        self._grabber = threading.Thread(target = self._grab_frames, args = (cap, self._grabber_stop), daemon = True)
+        self._grabber.start()
         
         # Ensure the GUI window stays on top
         QTimer.singleShot(0, self.gui_window.focus_window)
 
-    def calculate_landmark_position(self, landmark, image_shape):
-        """Calculate pixel position from normalized landmark coordinates"""
+    def _landmark_positions(self, landmark_list, indices, image_shape):
+        """Calculate pixel positions of the given landmarks as an (N, 2) int32 array"""
         ih, iw = image_shape[:2]  # Height and width
-        pixel_x = int(landmark.x * iw)
-        pixel_y = int(landmark.y * ih)
-        return (pixel_x, pixel_y)
+        landmark = landmark_list.landmark
+        # Read only the requested landmarks straight into a flat float32 buffer, without building per-landmark tuples
+        coords = np.fromiter((v for idx in indices for v in (landmark[idx].x, landmark[idx].y)),
+                             dtype = np.float32, count = 2 * len(indices)).reshape(-1, 2)
+        coords *= (iw, ih)
+        return coords.astype(np.int32)
 
     def _process_face_landmarks(self, frame, face_landmark):
         """Process and draw face landmarks"""
-        face_landmarks = {}
-        
-        # Extract specific landmarks
-        landmarks_to_process = self.config.MOUTH_LANDMARKS + self.config.FOREHEAD_LANDMARKS
-        
-        # Pre-calculate frame shape once
-        frame_shape = frame.shape
+        # Extract the mouth and forehead landmarks in one pass
+        positions = self._landmark_positions(face_landmark, self.config.MOUTH_AND_FOREHEAD_LANDMARKS, frame.shape)
         
-        for idx in landmarks_to_process:
-            landmark = face_landmark.landmark[idx]
-            pos = self.calculate_landmark_position(landmark, frame_shape)
-            face_landmarks[idx] = pos
-            
-            # Draw landmarks
+        # Draw landmarks
+        for pos in positions.tolist():
             cv2.circle(frame, pos, 5, self._green, -1)
         
-        return face_landmarks
+        # Split into mouth and forehead arrays so each habit can be checked against all of its points at once
+        mouth_count = len(self.config.MOUTH_LANDMARKS)
+        return positions[:mouth_count], positions[mouth_count:]
 
-    def _process_hand_landmarks(self, frame, hand_landmarks, face_landmarks):
+    def _process_hand_landmarks(self, frame, hand_landmarks, mouth_pts, forehead_pts):
         """Process hand landmarks and detect habits"""
         nail_biting_detected = False
         hair_pulling_detected = False
         
-        # Pre-calculate frame shape once
-        frame_shape = frame.shape
-        
-        # Get thumb position
-        thumb_pos = self._get_thumb_position(frame, hand_landmarks, frame_shape)
-        
-        # Get other fingertip positions
-        other_fingertips = self._get_other_fingertip_positions(frame, hand_landmarks, frame_shape)
+        # Get all fingertip positions in one pass (thumb first, then the other fingertips)
+        fingertip_pts = self._get_fingertip_positions(frame, hand_landmarks)
+        thumb_pos = tuple(fingertip_pts[0].tolist())
+        other_fingertips = fingertip_pts[1:]
         
         # Check for nail biting
-        nail_biting_detected = self._check_nail_biting(frame, hand_landmarks, face_landmarks, frame_shape)
+        if self.enable_nail_detection:
+            nail_biting_detected = self._check_nail_biting(frame, fingertip_pts, mouth_pts)
         
         # Check for hair pulling
-        hair_pulling_detected = self._check_hair_pulling(
-            frame, thumb_pos, other_fingertips, face_landmarks
-        )
+        if self.enable_hair_detection:
+            hair_pulling_detected = self._check_hair_pulling(
+                frame, thumb_pos, other_fingertips, forehead_pts
+            )
         
         return nail_biting_detected, hair_pulling_detected
 
-    def _get_thumb_position(self, frame, hand_landmarks, frame_shape=None):
-        """Get and draw thumb position"""
-        if frame_shape is None:
-            frame_shape = frame.shape
-            
-        thumb_tip = hand_landmarks.landmark[self.config.THUMB_TIP]
-        thumb_pos = self.calculate_landmark_position(thumb_tip, frame_shape)
-        cv2.circle(frame, thumb_pos, 8, self._yellow, -1)
-        return thumb_pos
-
-    def _get_other_fingertip_positions(self, frame, hand_landmarks, frame_shape=None):
-        """Get and draw other fingertip positions"""
-        if frame_shape is None:
-            frame_shape = frame.shape
-            
-        positions = {}
-        for finger_id in self.config.OTHER_FINGERTIPS:
-            fingertip = hand_landmarks.landmark[finger_id]
-            pos = self.calculate_landmark_position(fingertip, frame_shape)
-            positions[finger_id] = pos
+    def _get_fingertip_positions(self, frame, hand_landmarks):
+        """Get and draw fingertip positions as an (N, 2) array"""
+        positions = self._landmark_positions(hand_landmarks, self.config.FINGERTIP_LANDMARKS, frame.shape)
+        for pos in positions.tolist():
             cv2.circle(frame, pos, 8, self._yellow, -1)
         return positions
 
-    def _check_nail_biting(self, frame, hand_landmarks, face_landmarks, frame_shape=None):
+    def _check_nail_biting(self, frame, finger_pts, mouth_pts):
         """Check for nail biting behavior"""
-        if frame_shape is None:
-            frame_shape = frame.shape
-            
-        is_biting = False
-        for point_id in self.config.FINGERTIP_LANDMARKS:
-            fingertip = hand_landmarks.landmark[point_id]
-            finger_pos = self.calculate_landmark_position(fingertip, frame_shape)
-            
-            biting_detected, mouth_pos = self.habit_detector.check_nail_biting(finger_pos, face_landmarks)
-            if biting_detected:
-                cv2.line(frame, finger_pos, mouth_pos, self._red, 2)
-                is_biting = True
-        return is_biting
+        close = self.habit_detector.check_nail_biting(finger_pts, mouth_pts)
+        
+        # Draw a line from each biting fingertip to the first mouth landmark it is close to
+        for finger_idx in np.flatnonzero(close.any(axis = 1)):
+            mouth_idx = close[finger_idx].argmax()
+            cv2.line(frame, tuple(finger_pts[finger_idx].tolist()), tuple(mouth_pts[mouth_idx].tolist()), self._red, 2)
+        return bool(close.any())
 
-    def _check_hair_pulling(self, frame, thumb_pos, other_fingertips, face_landmarks):
+    def _check_hair_pulling(self, frame, thumb_pos, other_fingertips, forehead_pts):
         """Check for hair pulling behavior"""
-        is_pulling = False
-        for forehead_idx in self.config.FOREHEAD_LANDMARKS:
-            if forehead_idx in face_landmarks:
-                forehead_pos = face_landmarks[forehead_idx]
-                
-                for finger_pos in other_fingertips.values():
-                    if self.habit_detector.check_hair_pulling(thumb_pos, finger_pos, forehead_pos, forehead_idx):
-                        self._draw_hair_pulling_triangle(frame, thumb_pos, finger_pos, forehead_pos)
-                        is_pulling = True
-        return is_pulling
+        pulling = self.habit_detector.check_hair_pulling(thumb_pos, other_fingertips, forehead_pts)
+        
+        # Draw a triangle for every finger/forehead pair that was detected
+        for finger_idx, forehead_idx in np.argwhere(pulling).tolist():
+            self._draw_hair_pulling_triangle(frame, thumb_pos, tuple(other_fingertips[finger_idx].tolist()),
+                                             tuple(forehead_pts[forehead_idx].tolist()))
+        return bool(pulling.any())
 
     def _draw_hair_pulling_triangle(self, frame, thumb_pos, finger_pos, forehead_pos):
         """Draw triangle for hair pulling visualization"""
@@ -192,18 +200,15 @@ class Camera:
     def _process_pose_landmarks(self, frame, pose_landmark):
         """Process and draw pose landmarks for slouch detection"""
         # Draw shoulder (pose) landmarks (indices 11 and 12)
-        shoulder_indices = [11, 12]
+        shoulder_indices = (11, 12)
         
-        # Draw only the shoulder landmarks
-        for idx in shoulder_indices:
-            landmark = pose_landmark.landmark[idx]
-            pos = self.calculate_landmark_position(landmark, frame.shape)
-            cv2.circle(frame, pos, 5, self._white, -1)
+        # Draw only the shoulder landmarks, computing their positions once for both the points and the line
+        start_point, end_point = self._landmark_positions(pose_landmark, shoulder_indices, frame.shape).tolist()
+        cv2.circle(frame, start_point, 5, self._white, -1)
+        cv2.circle(frame, end_point, 5, self._white, -1)
             
         # Draw connection between shoulders
         if all(pose_landmark.landmark[idx].visibility > 0.5 for idx in shoulder_indices):
-            start_point = self.calculate_landmark_position(pose_landmark.landmark[shoulder_indices[0]], frame.shape)
-            end_point = self.calculate_landmark_position(pose_landmark.landmark[shoulder_indices[1]], frame.shape)
             cv2.line(frame, start_point, end_point, self._white, 2)
         
         # If calibrating, update calibration
@@ -211,10 +216,11 @@ class Camera:
             calibration_complete = self.slouch_detector.update_calibration(frame, pose_landmark)
             if calibration_complete:
                 self.is_calibrating = False
-                self.calibration_complete_time = time.time()  # Record when calibration completed
+                self.calibration_complete_time = time.monotonic()  # Record when calibration completed
                 # Ensure slouch detector is marked as calibrated
                 self.slouch_detector.calibrated = True
                 print("Calibration complete and status updated")
+                self.calibration_done.emit(True)
         
         # If not calibrated and not currently calibrating, show a message about posture percentage
         if not self.slouch_detector.calibrated and not self.is_calibrating:
@@ -224,54 +230,217 @@ class Camera:
         # Check for slouching
         return self.slouch_detector.check_slouching(frame, pose_landmark)
 
+    def _scale_for_display(self, frame):
+        """Return a copy of the frame resized to fit the GUI camera view while keeping its aspect ratio"""
+        if self.display_size is None:
+            return frame.copy()
+        
+        # Only recompute the target size when the frame or view size changes
+        key = (frame.shape, self.display_size)
+        if key != self._display_scale_key:
+            view_w, view_h = self.display_size
+            frame_h, frame_w = frame.shape[:2]
+            scale = min(view_w / frame_w, view_h / frame_h)
+            self._display_target_size = (max(1, int(frame_w * scale)), max(1, int(frame_h * scale)))
+            self._display_scale_key = key
+        
+        # A new buffer per frame since the GUI thread may still be reading the previous one
+        return cv2.resize(frame, self._display_target_size, interpolation = cv2.INTER_AREA)
+
+    def configure(self, nail_distance, hair_distance, nail_detection, hair_detection, slouch_detection,
+                  show_notifications, show_screen_outline, show_red_tint, alarm_volume, camera_fps, **_):
+        """Apply the GUI settings (keys of the settings file) to the detectors and alerts in one call"""
+        self.habit_detector.update_thresholds(nail_distance, hair_distance)
+        self.processing_delay = 1.0 / camera_fps  # Convert FPS to seconds
+        
+        self.enable_nail_detection = nail_detection
+        self.enable_hair_detection = hair_detection
+        self.enable_slouch_detection = slouch_detection
+        
+        self.screen_overlay.show_notification = show_notifications
+        self.screen_overlay.show_outline_enabled = show_screen_outline
+        self.screen_overlay.show_red_tint = show_red_tint
+        self.screen_overlay.alarm_volume = alarm_volume / 100.0  # Convert percentage to 0-1 range
+
     def start_calibration(self):
         """Start the slouch detection calibration process"""
+        self._last_calibration_progress = None
         self.is_calibrating = True
         self.slouch_detector.start_calibration()
 
+    def _report_calibration_progress(self):
+        """Emit the calibration countdown or progress to the GUI when it has changed"""
+        detector = self.slouch_detector
+        elapsed = time.monotonic() - detector.calibration_start_time
+        
+        if detector.calibration_countdown > 0:
+            remaining = detector.calibration_countdown - elapsed
+            if remaining <= 0:
+                return
+            state = (0, f"Calibration in {int(remaining)+1}...")
+        else:
+            duration = detector.calibration_duration
+            if elapsed >= duration:
+                return
+            state = (int((elapsed / duration) * 100), "Calibrating posture... Stay still and sit up straight!")
+        
+        if state != self._last_calibration_progress:
+            self._last_calibration_progress = state
+            self.calibration_progress.emit(*state)
+
     def get_current_frame(self):
-        """Return the current camera frame for display in the GUI panel"""
-        return self.current_frame
+        """Return the latest (frame, QImage, frame_id) for display in the GUI panel"""
+        with self._display_lock:
+            if self._display_frames:
+                return self._display_frames[-1]
+        return (None, None, 0)
     
     def start_camera_no_window(self):
-        """Start camera processing in a background thread without showing its own window"""
+        """Start (or resume) camera processing in a background thread without showing its own window"""
+        self.capture_enabled.set()
+        if self.thread is not None and self.thread.is_alive():
+            return
         self.running = True
         self.thread = threading.Thread(target=self._camera_thread_function)
         self.thread.daemon = True
         self.thread.start()
     
+    def pause_camera(self):
+        """Pause camera processing, keeping the thread and MediaPipe models alive for a quick restart"""
+        self.capture_enabled.clear()
+        self.display_enabled = False
+        self._cancel_calibration()
+        with self._display_lock:
+            self._display_frames.clear()
+    
+    def _cancel_calibration(self):
+        """End a calibration that can no longer finish and let the GUI know"""
+        if self.is_calibrating:
+            self.is_calibrating = False
+            self.calibration_done.emit(False)
+    
+    def _grab_frames(self, cap, stop):
+        """Keep grabbing frames from cap into the single frame slot, so the camera thread always takes the newest one
+        
+        Runs on its own thread until stop is set or the camera is paused or stopped. This thread is the
+        only one that reads cap, and it releases cap when it exits. Frames are only decoded (retrieved)
+        when the camera thread has requested one.
+        """
+        try:
+            while not stop.is_set() and self.running and self.capture_enabled.is_set():
+                ret = cap.grab()
+                frame = None
+                if ret and self._retrieve_requested.is_set():
+                    self._retrieve_requested.clear()
+                    ret, frame = cap.retrieve()
+                # Replace whatever the camera thread hasn't taken yet with the newer grab
+                with self._frame_lock:
+                    self._frame_slot = (ret, frame)
+                self._frame_grabbed.set()
+                if not ret:
+                    time.sleep(0.1)  # Don't spin on a device that isn't delivering frames
+        finally:
+            try:
+                cap.release()
+            except Exception as e:
+                print(f"Error releasing camera: {e}")
+    
+    def _release_capture(self):
+        """Stop the grabber thread and release the capture device if it is open"""
+        grabber, self._grabber = self._grabber, None
+        self.cap = None
+        if grabber is not None:
+            self._grabber_stop.set()
+            # The grabber releases the device on exit; if a read is stuck, it does so once the read returns
+            grabber.join(timeout = 2.0)
+    
     def _camera_thread_function(self):
         """Background thread function for camera processing"""
-        self._initialize_camera()
-        
         while self.running:
-            # Get and process frame
-            ret, frame = self.cap.read()
+            if not self.capture_enabled.is_set():
+                # Free the device while paused (so its light turns off) and sleep until resumed or stopped
+                self._release_capture()
+                self.capture_enabled.wait()
+                continue
+            
+            if self.cap is None:
+                self._initialize_camera()
+            
+            # Only have the grabber decode a frame when something needs the pixels
+            needs_frame = (self.display_enabled or self.is_calibrating or self.enable_nail_detection
+                           or self.enable_hair_detection or self.enable_slouch_detection)
+            if needs_frame:
+                self._retrieve_requested.set()
+            
+            # Take grabs out of the slot until the requested frame arrives (any grab will do if none is needed)
+            ret, frame = False, None
+            deadline = time.monotonic() + 2.0
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._frame_grabbed.wait(timeout = remaining):
+                    ret, frame = False, None
+                    break
+                self._frame_grabbed.clear()
+                with self._frame_lock:
+                    slot, self._frame_slot = self._frame_slot, None
+                if slot is None:
+                    continue
+                ret, frame = slot
+                if not ret or frame is not None or not needs_frame:
+                    break
+            
+            # Pausing or stopping ends the grabber, so a missing frame then isn't a device failure
+            if not self.running or not self.capture_enabled.is_set():
+                continue
 
             # If camera is unavailable (i.e. sleeping)
             if not ret:
                 print("Frame grab failed. Trying to reinitialize...")
                 time.sleep(1)
+                # Stop the old grabber and release its device before opening a new one
+                self._release_capture()
                 self._initialize_camera()
                 continue
+            
+            if not needs_frame:
+                # Nothing to detect or display, so let any active alerts clear
+                self.screen_overlay.update_habit_status(False, False, False)
+                time.sleep(self.processing_delay)
+                continue
 
             try:
-                # Convert and process frame with MediaPipe - only convert once
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                # Run inference on a downscaled copy; landmarks are normalized, so they still map onto the full frame
+                inference_frame = frame
+                h, w = frame.shape[:2]
+                if w > self._inference_width:
+                    inference_size = (self._inference_width, round(h * self._inference_width / w))
+                    inference_frame = cv2.resize(frame, inference_size, interpolation = cv2.INTER_AREA)
+
+                # Convert and process frame with MediaPipe - only convert once, into a buffer reused across frames
+                if self._rgb_frame is None or self._rgb_frame.shape != inference_frame.shape:
+                    self._rgb_frame = np.empty_like(inference_frame)
+                rgb_frame = self._rgb_frame
+                rgb_frame.flags.writeable = True
+                cv2.cvtColor(inference_frame, cv2.COLOR_BGR2RGB, dst = rgb_frame)
+                rgb_frame.flags.writeable = False  # Read-only lets MediaPipe use the frame without copying it
                 
-                # Process all MediaPipe models in parallel
+                # Process the MediaPipe models in parallel (pose on the pool, hands and face mesh on this thread)
+                pose_future = self._inference_pool.submit(self.mp_handler.pose.process, rgb_frame)
                 hands_results = self.mp_handler.hands.process(rgb_frame)
-                face_results = self.mp_handler.face_mesh.process(rgb_frame)
-                pose_results = self.mp_handler.pose.process(rgb_frame)
+                # Nail biting and hair pulling both need a hand, so the face mesh only runs when one is visible
+                face_results = None
+                if hands_results.multi_hand_landmarks:
+                    face_results = self.mp_handler.face_mesh.process(rgb_frame)
+                pose_results = pose_future.result()
 
                 # Add a small delay to throttle processing rate
                 time.sleep(self.processing_delay)
 
                 # Process face landmarks
-                face_landmarks = {}
-                if face_results.multi_face_landmarks:
+                mouth_pts = forehead_pts = None
+                if face_results and face_results.multi_face_landmarks:
                     for face_landmark in face_results.multi_face_landmarks:
-                        face_landmarks = self._process_face_landmarks(frame, face_landmark)
+                        mouth_pts, forehead_pts = self._process_face_landmarks(frame, face_landmark)
                         break  # Only process the first face for efficiency
 
                 # Process pose landmarks for slouch detection
@@ -283,40 +452,55 @@ class Camera:
                 nail_biting = False
                 hair_pulling = False
                 
-                if hands_results.multi_hand_landmarks and face_landmarks:
+                if hands_results.multi_hand_landmarks and mouth_pts is not None:
                     for hand_landmarks in hands_results.multi_hand_landmarks:
                         # Process each hand and combine the results
                         hand_nail_biting, hand_hair_pulling = self._process_hand_landmarks(
-                            frame, hand_landmarks, face_landmarks
+                            frame, hand_landmarks, mouth_pts, forehead_pts
                         )
                         # If either hand is doing the habit, mark it as detected
-                        if self.enable_nail_detection:
-                            nail_biting = nail_biting or hand_nail_biting
-                        if self.enable_hair_detection:
-                            hair_pulling = hair_pulling or hand_hair_pulling
+                        nail_biting = nail_biting or hand_nail_biting
+                        hair_pulling = hair_pulling or hand_hair_pulling
 
                 # Display alerts
                 self._display_alerts(frame, nail_biting, hair_pulling, slouching_detected)
+                
+                # Let the GUI know how far along calibration is
+                if self.is_calibrating:
+                    self._report_calibration_progress()
 
-                # Store the current frame for external access
-                self.current_frame = frame.copy()
+                # Hand the frame to the GUI (only needed while it is displayed)
+                if self.display_enabled or self.is_calibrating:
+                    display_frame = self._scale_for_display(frame)
+                    h, w = display_frame.shape[:2]
+                    # Wrap the BGR frame in a QImage here so the GUI thread only has to convert it to a pixmap
+                    qt_image = QImage(display_frame.data, w, h, display_frame.strides[0], QImage.Format.Format_BGR888)
+                    self.frame_id += 1
+                    with self._display_lock:
+                        self._display_frames.append((display_frame, qt_image, self.frame_id))
+                    self.frame_ready.emit()
                     
             except Exception as e:
                 print(f"Error processing frame: {e}")
                 time.sleep(0.5)  # Wait a bit before retrying
+        
+        # Release the device from the thread that uses it
+        self._release_capture()
     
     def stop_camera(self):
         """Stop the camera processing thread and clean up resources"""
         self.running = False
+        self.capture_enabled.set()  # Wake the thread if it is paused so it can exit
+        self._cancel_calibration()
         
-        # Wait for thread to finish
+        # Wait for thread to finish; it releases the camera itself on exit
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=1.0)
         
-        # Release camera resources
-        if self.cap is not None:
-            try:
-                self.cap.release()
-                self.cap = None
-            except Exception as e:
-                print(f"Error releasing camera: {e}")
\ No newline at end of file
+        # Only release here if the thread is gone, so a slow frame isn't cut off mid-read
+        if self.thread is None or not self.thread.is_alive():
+            self._release_capture()
+        self._inference_pool.shutdown(wait = False)
+        
+        # Close the alert windows along with the camera
+        self.screen_overlay.shutdown()
\ No newline at end of file
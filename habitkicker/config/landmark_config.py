@@ -2,16 +2,19 @@
 
 class LandmarkConfig:
     # Mouth landmarks
-    MOUTH_LANDMARKS = [13, 14]  # Lip center points
+    MOUTH_LANDMARKS = (13, 14)  # Lip center points
     
     # Forehead landmarks
-    FOREHEAD_LANDMARKS = [
+    FOREHEAD_LANDMARKS = (
         93, 234, 127, 162, 21, 54, 103,  # Left side
         # 67, 109, 10, 338, 297,  # Center (excluded)
         332, 284, 251, 389, 356, 454, 323  # Right side
-    ]  # Head circumference points
+    )  # Head circumference points
+    
+    # All face landmarks that are processed, mouth first (so each frame reads them in a single pass)
+    MOUTH_AND_FOREHEAD_LANDMARKS = MOUTH_LANDMARKS + FOREHEAD_LANDMARKS
     
     # Hand landmarks
-    FINGERTIP_LANDMARKS = [4, 8, 12, 16, 20]  # Fingertips
+    FINGERTIP_LANDMARKS = (4, 8, 12, 16, 20)  # Fingertips, thumb first
     THUMB_TIP = 4  # Thumb tip
-    OTHER_FINGERTIPS = [8, 12, 16, 20]  # Other fingertips 
\ No newline at end of file
+    OTHER_FINGERTIPS = (8, 12, 16, 20)  # Other fingertips 
\ No newline at end of file
@@ -7,37 +7,56 @@ class HabitDetector:
     def __init__(self, max_nail_pulling_distance, max_hair_pulling_distance):
         self.NAIL_PULLING_THRESHOLD = max_nail_pulling_distance
         self.HAIR_PULLING_THRESHOLD = max_hair_pulling_distance
+        self._nail_threshold_sq = max_nail_pulling_distance ** 2  # Compared against squared distances, skipping the sqrt
+        self._hair_threshold_sq = max_hair_pulling_distance ** 2
+        self._finger_to_thumb_sq = 30 ** 2  # The thumb and the other finger must be this close to be pinching
         self.config = LandmarkConfig()
+        # -1 for forehead landmarks on the left side of the face, 1 for the right side
+        self._forehead_side = np.where(np.arange(len(self.config.FOREHEAD_LANDMARKS)) < 7, -1, 1)
 
-    def check_nail_biting(self, fingertip_pos, face_landmarks):
-        """Check if a fingertip is close to any mouth landmark"""
-        for mouth_idx in self.config.MOUTH_LANDMARKS:
-            if mouth_idx in face_landmarks:
-                mouth_pos = face_landmarks[mouth_idx]
-                distance = np.linalg.norm(np.array(fingertip_pos) - np.array(mouth_pos))
-                if distance < self.NAIL_PULLING_THRESHOLD:
-                    return True, mouth_pos
-        return False, None
+    def update_thresholds(self, max_nail_pulling_distance, max_hair_pulling_distance):
+        """Update both distance thresholds at once (called from the GUI thread)
+        
+        Each assignment is atomic, and every check reads its threshold only once, so no lock is needed
+        """
+        self.NAIL_PULLING_THRESHOLD = max_nail_pulling_distance
+        self.HAIR_PULLING_THRESHOLD = max_hair_pulling_distance
+        self._nail_threshold_sq = max_nail_pulling_distance ** 2
+        self._hair_threshold_sq = max_hair_pulling_distance ** 2
+
+    def check_nail_biting(self, finger_pts, mouth_pts):
+        """Check which fingertips are close to which mouth landmarks
+        
+        Takes (F, 2) fingertip and (M, 2) mouth position arrays and returns an (F, M) boolean array
+        """
+        # Squared distances between every fingertip/mouth pair at once
+        diff = finger_pts[:, None, :] - mouth_pts[None, :, :]
+        return np.einsum("fmk,fmk->fm", diff, diff) < self._nail_threshold_sq
 
-    def check_hair_pulling(self, thumb_pos, finger_pos, forehead_pos, forehead_idx):
-        """Check if thumb and another finger are close to a forehead landmark"""
+    def check_hair_pulling(self, thumb_pos, finger_pts, forehead_pts):
+        """Check which fingers are pulling hair together with the thumb, near which forehead landmarks
+        
+        Takes the thumb position, an (F, 2) array of the other fingertips and an (H, 2) array of the
+        forehead landmarks (in FOREHEAD_LANDMARKS order), and returns an (F, H) boolean array
+        """
+        thumb = np.asarray(thumb_pos)
+        threshold_sq = self._hair_threshold_sq  # Read once so both comparisons use the same threshold
+        forehead_x, forehead_y = forehead_pts[:, 0], forehead_pts[:, 1]
+        finger_x, finger_y = finger_pts[:, 0:1], finger_pts[:, 1:2]  # (F, 1) columns broadcast against the forehead
+        
         # Check if either thumb or finger is above forehead
-        if not (thumb_pos[1] < forehead_pos[1] or finger_pos[1] < forehead_pos[1]):
-            return False
-            
+        above = (thumb[1] < forehead_y) | (finger_y < forehead_y)
+        
         # Check if forehead landmark is on left/right side and fingers are to the left/right respectively (avoids false positives)
-        left_forehead_landmarks = self.config.FOREHEAD_LANDMARKS[0:7]
-        right_forehead_landmarks = self.config.FOREHEAD_LANDMARKS[7:14]
-        if forehead_idx in left_forehead_landmarks and not (thumb_pos[0] < forehead_pos[0] and finger_pos[0] < forehead_pos[0]):
-            return False
-        elif forehead_idx in right_forehead_landmarks and not (thumb_pos[0] > forehead_pos[0] and finger_pos[0] > forehead_pos[0]):
-            return False
-            
-        thumb_to_forehead = np.linalg.norm(np.array(thumb_pos) - np.array(forehead_pos))
-        if thumb_to_forehead < self.HAIR_PULLING_THRESHOLD:
-            finger_to_forehead = np.linalg.norm(np.array(finger_pos) - np.array(forehead_pos))
-            finger_to_thumb = np.linalg.norm(np.array(finger_pos) - np.array(thumb_pos))
-            
-            return (finger_to_forehead < self.HAIR_PULLING_THRESHOLD and 
-                   finger_to_thumb < 30)
-        return False 
\ No newline at end of file
+        side = self._forehead_side
+        outside = ((thumb[0] - forehead_x) * side > 0) & ((finger_x - forehead_x) * side > 0)
+        
+        # Thumb and finger must both be near the forehead landmark, and near each other (squared distances)
+        thumb_diff = forehead_pts - thumb
+        finger_diff = forehead_pts[None, :, :] - finger_pts[:, None, :]
+        pinch_diff = finger_pts - thumb
+        close = ((np.einsum("hk,hk->h", thumb_diff, thumb_diff) < threshold_sq)
+                 & (np.einsum("fhk,fhk->fh", finger_diff, finger_diff) < threshold_sq)
+                 & (np.einsum("fk,fk->f", pinch_diff, pinch_diff) < self._finger_to_thumb_sq)[:, None])
+        
+        return above & outside & close
@@ -29,6 +29,19 @@ class SlouchDetector:
         self.slouch_calculation_interval = 0.1  # Calculate slouch every 100ms
         self.last_slouch_percentage = 0
         self.last_slouch_detected = False
+        self._last_pose_key = None  # Quantized pose of the last calculation, used to skip static frames
+        
+        # Reference values derived from the calibration landmarks (constant until recalibration)
+        self._ref_distance_inv = 0.0
+        self._cal_nose_neck_dist_inv = 0.0
+        
+        # Text sprite cache: pre-rendered masks for the posture text, keyed by string
+        self._text_font = cv2.FONT_HERSHEY_SIMPLEX
+        self._text_scale = 1
+        self._text_thickness = 2
+        self._text_sprites = {}
+        for char in "0123456789-":
+            self._get_text_sprite(char)
         
         # Try to load existing calibration data
         self.load_calibration()
@@ -38,12 +51,13 @@ class SlouchDetector:
         self.calibrated = False
         self.calibration_landmarks = None
         self.calibration_countdown = 3  # 3 second countdown before calibration
-        self.calibration_start_time = time.time()
+        self.calibration_start_time = time.monotonic()
         self.calibration_samples = []  # Reset samples
+        self._last_pose_key = None
         
     def update_calibration(self, frame, pose_landmarks):
         """Update calibration process and draw UI elements"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Handle countdown phase
         if self.calibration_countdown > 0:
@@ -99,79 +113,59 @@ class SlouchDetector:
             print("Warning: No calibration samples collected")
             return
             
-        # Average all collected samples
+        # Average all collected samples (each landmark is a float32 (x, y, z) array)
         avg_landmarks = {}
-        
-        # Initialize with the structure of the first sample
         for key in self.calibration_samples[0].keys():
-            # Each landmark has 3 coordinates (x, y, z)
-            avg_landmarks[key] = [0, 0, 0]
-        
-        # Sum all samples
-        for sample in self.calibration_samples:
-            for key, coords in sample.items():
-                for i in range(3):  # x, y, z
-                    avg_landmarks[key][i] += coords[i]
-        
-        # Divide by number of samples to get average
-        for key in avg_landmarks.keys():
-            for i in range(3):  # x, y, z
-                avg_landmarks[key][i] /= len(self.calibration_samples)
-            
-            # Convert lists back to tuples
-            avg_landmarks[key] = tuple(avg_landmarks[key])
+            avg_landmarks[key] = np.mean(
+                [sample[key] for sample in self.calibration_samples], axis = 0, dtype = np.float32
+            )
         
         # Store the averaged landmarks
         self.calibration_landmarks = avg_landmarks
         self.calibrated = True
+        self._update_reference_values()
         print(f"Calibration complete with {len(self.calibration_samples)} samples")
         
         # Save the calibration data
         self.save_calibration()
     
+    def _update_reference_values(self):
+        """Cache the reciprocal reference distances used by the slouch calculation"""
+        cal = self.calibration_landmarks
+        
+        # Vertical distance between nose and shoulder midpoint (as a percentage multiplier)
+        ref = abs(cal['nose'][1] - 0.5 * (cal['left_shoulder'][1] + cal['right_shoulder'][1]))
+        self._ref_distance_inv = 100.0 / ref if ref > 0 else 0.0
+        
+        # Calibrated nose-neck distance
+        cal_nose_neck_dist_sq = self._squared_distance(cal['nose'][:2], cal['neck'][:2])
+        cal_nose_neck_dist = np.sqrt(cal_nose_neck_dist_sq) if cal_nose_neck_dist_sq > 0 else 0.001
+        self._cal_nose_neck_dist_inv = 1.0 / cal_nose_neck_dist
+        
+        # Force the next check to recalculate against the new reference
+        self._last_pose_key = None
+    
     def _extract_posture_landmarks(self, pose_landmarks):
         """Extract relevant landmarks for posture analysis"""
         # We're only interested in upper body landmarks (shoulders, neck, nose)
         landmarks = {}
         
         if hasattr(pose_landmarks, 'landmark'):
+            lm = pose_landmarks.landmark
+            
             # Extract shoulder landmarks (11 and 12 in MediaPipe Pose)
-            landmarks['left_shoulder'] = (
-                pose_landmarks.landmark[11].x,
-                pose_landmarks.landmark[11].y,
-                pose_landmarks.landmark[11].z
-            )
-            landmarks['right_shoulder'] = (
-                pose_landmarks.landmark[12].x,
-                pose_landmarks.landmark[12].y,
-                pose_landmarks.landmark[12].z
-            )
+            landmarks['left_shoulder'] = np.array((lm[11].x, lm[11].y, lm[11].z), dtype = np.float32)
+            landmarks['right_shoulder'] = np.array((lm[12].x, lm[12].y, lm[12].z), dtype = np.float32)
             
             # Extract neck landmark (mid-point between shoulders)
-            landmarks['neck'] = (
-                (pose_landmarks.landmark[11].x + pose_landmarks.landmark[12].x) / 2,
-                (pose_landmarks.landmark[11].y + pose_landmarks.landmark[12].y) / 2,
-                (pose_landmarks.landmark[11].z + pose_landmarks.landmark[12].z) / 2
-            )
+            landmarks['neck'] = (landmarks['left_shoulder'] + landmarks['right_shoulder']) * np.float32(0.5)
             
             # Nose landmark for vertical alignment
-            landmarks['nose'] = (
-                pose_landmarks.landmark[0].x,
-                pose_landmarks.landmark[0].y,
-                pose_landmarks.landmark[0].z
-            )
+            landmarks['nose'] = np.array((lm[0].x, lm[0].y, lm[0].z), dtype = np.float32)
             
             # Add ear landmarks for head tilt detection
-            landmarks['left_ear'] = (
-                pose_landmarks.landmark[7].x,
-                pose_landmarks.landmark[7].y,
-                pose_landmarks.landmark[7].z
-            )
-            landmarks['right_ear'] = (
-                pose_landmarks.landmark[8].x,
-                pose_landmarks.landmark[8].y,
-                pose_landmarks.landmark[8].z
-            )
+            landmarks['left_ear'] = np.array((lm[7].x, lm[7].y, lm[7].z), dtype = np.float32)
+            landmarks['right_ear'] = np.array((lm[8].x, lm[8].y, lm[8].z), dtype = np.float32)
             
         return landmarks
     
@@ -180,10 +174,16 @@ class SlouchDetector:
         if not self.calibrated or not pose_landmarks:
             return False
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Only recalculate slouch at certain intervals to improve performance
         if current_time - self.last_slouch_calculation_time >= self.slouch_calculation_interval:
+            # Skip the calculation if the pose hasn't moved since the last one (user is still)
+            pose_key = self._get_pose_key(pose_landmarks)
+            if pose_key is not None and pose_key == self._last_pose_key:
+                self.last_slouch_calculation_time = current_time
+                return self._draw_last_slouch_result(frame)
+            
             current_landmarks = self._extract_posture_landmarks(pose_landmarks)
             
             # If we couldn't extract the necessary landmarks, return False
@@ -193,8 +193,23 @@ class SlouchDetector:
             # Calculate slouch metrics
             self.last_slouch_detected, self.last_slouch_percentage = self._calculate_slouch(current_landmarks)
             self.last_slouch_calculation_time = current_time
+            self._last_pose_key = pose_key
+        
+        return self._draw_last_slouch_result(frame)
+    
+    def _get_pose_key(self, pose_landmarks):
+        """Quantize the shoulder and nose landmarks into a key that only changes when the user moves
+        
+        Covers the x and y of every landmark the slouch calculation reads from (both shoulders and the nose)
+        """
+        if not hasattr(pose_landmarks, 'landmark'):
+            return None
         
-        # Always draw the slouch percentage
+        lm = pose_landmarks.landmark
+        return tuple(int(v * 1024) for idx in (11, 12, 0) for v in (lm[idx].x, lm[idx].y))
+    
+    def _draw_last_slouch_result(self, frame):
+        """Draw the most recent slouch percentage and return whether slouching was detected"""
         if self.last_slouch_detected:
             self._draw_slouch_alert(frame, self.last_slouch_percentage)
         else:
@@ -238,21 +253,14 @@ class SlouchDetector:
         
         # 3. Calculate distance between nose and neck (shorter when slouching)
         # Use squared distance for better performance
-        cal_nose_neck_dist_sq = self._squared_distance(
-            self.calibration_landmarks['nose'][:2],  # Only use x,y coordinates
-            self.calibration_landmarks['neck'][:2]
-        )
-        
         curr_nose_neck_dist_sq = self._squared_distance(
-            current_landmarks['nose'][:2],
+            current_landmarks['nose'][:2],  # Only use x,y coordinates
             current_landmarks['neck'][:2]
         )
         
         # Calculate distance ratio (less than 1 means slouching)
-        # Take square root only once at the end for the ratio
-        cal_nose_neck_dist = np.sqrt(cal_nose_neck_dist_sq) if cal_nose_neck_dist_sq > 0 else 0.001
         curr_nose_neck_dist = np.sqrt(curr_nose_neck_dist_sq) if curr_nose_neck_dist_sq > 0 else 0
-        dist_ratio = curr_nose_neck_dist / cal_nose_neck_dist if cal_nose_neck_dist > 0 else 1
+        dist_ratio = curr_nose_neck_dist * self._cal_nose_neck_dist_inv
         
         # Combine metrics to calculate slouch percentage
         # Weight the metrics: shoulder position, angle change, distance ratio
@@ -260,12 +268,8 @@ class SlouchDetector:
         angle_factor =  0.1 # Head tilt angle
         distance_factor = 0.4 # Distance between nose and neck
         
-        # Calculate reference distance for shoulder movement percentage
-        ref_distance = abs(self.calibration_landmarks['nose'][1] - 
-                          (self.calibration_landmarks['left_shoulder'][1] + 
-                           self.calibration_landmarks['right_shoulder'][1]) / 2)
-        
-        shoulder_percentage = (avg_shoulder_diff / ref_distance) * 100 if ref_distance > 0 else 0
+        # Reference distance for shoulder movement percentage is cached at calibration time
+        shoulder_percentage = avg_shoulder_diff * self._ref_distance_inv
         angle_percentage = angle_diff * 2  # Scale angle difference to percentage
         distance_percentage = (1 - dist_ratio) * 100 if dist_ratio < 1 else 0
         
@@ -290,36 +294,47 @@ class SlouchDetector:
     
     def _draw_slouch_alert(self, frame, slouch_percentage):
         """Draw slouch alert on the frame"""
-        h, w, _ = frame.shape
-        
-        # Draw alert text
-        cv2.putText(
-            frame, 
-            f"Slouching: {int(slouch_percentage)}% (Threshold: {self.threshold_percentage}%)", 
-            (50, 130), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            1, 
-            (0, 0, 255), 
-            2
-        )
+        self._draw_posture_text(frame, "Slouching: ", slouch_percentage, (0, 0, 255))
     
     def _draw_slouch_percentage(self, frame, slouch_percentage):
         """Draw slouch percentage on the frame when not slouching"""
         # Calculate color based on how close to threshold (green to yellow)
-        ratio = min(slouch_percentage / self.threshold_percentage, 0.9)  # Cap at 90% of threshold
+        ratio = min(max(slouch_percentage / self.threshold_percentage, 0.0), 0.9)  # Clamp to 0-90% of threshold
         # Green (0, 255, 0) to Yellow (0, 255, 255)
         color = (0, 255, int(255 * ratio))
         
-        # Draw percentage text
-        cv2.putText(
-            frame, 
-            f"Posture: {int(slouch_percentage)}% (Threshold: {self.threshold_percentage}%)", 
-            (50, 130), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            1, 
-            color, 
-            2
-        )
+        self._draw_posture_text(frame, "Posture: ", slouch_percentage, color)
+    
+    def _draw_posture_text(self, frame, prefix, slouch_percentage, color):
+        """Draw "<prefix><percentage>% (Threshold: N%)" by blitting cached text sprites"""
+        parts = [prefix, *str(int(slouch_percentage)), f"% (Threshold: {self.threshold_percentage}%)"]
+        
+        x, y = 50, 130  # Text origin (bottom-left), same as cv2.putText
+        frame_h, frame_w = frame.shape[:2]
+        for part in parts:
+            mask, advance, baseline_offset = self._get_text_sprite(part)
+            top = y - baseline_offset
+            left = x - self._text_thickness
+            
+            # Clip the sprite to the frame
+            y0, y1 = max(top, 0), min(top + mask.shape[0], frame_h)
+            x0, x1 = max(left, 0), min(left + mask.shape[1], frame_w)
+            if y1 > y0 and x1 > x0:
+                frame[y0:y1, x0:x1][mask[y0 - top:y1 - top, x0 - left:x1 - left]] = color
+            
+            x += advance
+    
+    def _get_text_sprite(self, text):
+        """Get (and cache) a boolean mask of the rendered text with its advance and baseline offset"""
+        sprite = self._text_sprites.get(text)
+        if sprite is None:
+            (width, height), baseline = cv2.getTextSize(text, self._text_font, self._text_scale, self._text_thickness)
+            pad = self._text_thickness  # Room for the stroke thickness around the glyphs
+            mask = np.zeros((height + baseline + 2 * pad, width + 2 * pad), dtype = np.uint8)
+            cv2.putText(mask, text, (pad, height + pad), self._text_font, self._text_scale, 255, self._text_thickness)
+            sprite = (mask > 0, width, height + pad)
+            self._text_sprites[text] = sprite
+        return sprite
     
     def save_calibration(self):
         """Save calibration data to a file"""
@@ -349,7 +364,13 @@ class SlouchDetector:
                 self.calibration_landmarks = pickle.load(f)
                 
             if self.calibration_landmarks:
+                # Older calibration files store tuples of Python floats
+                self.calibration_landmarks = {
+                    key: np.asarray(coords, dtype = np.float32)
+                    for key, coords in self.calibration_landmarks.items()
+                }
                 self.calibrated = True
+                self._update_reference_values()
                 print(f"Calibration data loaded from {self.calibration_file}")
                 return True
             else:
@@ -2,16 +2,71 @@
 
 import os
 import time
-import json
+import logging
+import orjson
+from functools import partial
+from dataclasses import dataclass, asdict
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QSlider, QLabel, QCheckBox, QFrame, QSizePolicy,
     QProgressBar, QSystemTrayIcon, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QPixmap, QImage, QIcon, QAction
-from camera import Camera
-import cv2
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QAbstractAnimation
+from PyQt6.QtGui import QFont, QPixmap, QIcon, QAction, QPainter, QPalette, QFontMetrics, QColor
+
+log = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class Settings:
+    """User settings saved to habitkicker_settings.json, with their default values"""
+    nail_distance: int = 20
+    hair_distance: int = 110
+    nail_detection: bool = True
+    hair_detection: bool = True
+    slouch_detection: bool = True
+    show_notifications: bool = True
+    show_screen_outline: bool = True
+    show_red_tint: bool = True
+    alarm_volume: int = 15
+    camera_fps: int = 2
+
+class _NullScreenOverlay:
+    """Stand-in for ScreenOverlay while the camera is not running"""
+    is_tinted = False
+    current_color = None
+    alarm_sound = None
+
+    def call_on_tk_thread(self, func, *args):
+        pass
+
+    def set_outline_transparency(self, alpha):
+        pass
+
+    def hide_notification(self):
+        pass
+
+    def show_tint(self):
+        pass
+
+    def hide_tint(self):
+        pass
+
+class _NullHabitDetector:
+    """Stand-in for HabitDetector while the camera is not running"""
+    def update_thresholds(self, max_nail_pulling_distance, max_hair_pulling_distance):
+        pass
+
+class _NullCamera:
+    """Stand-in for Camera while the application is stopped, so callbacks don't need to check for a camera"""
+    cap = None
+    is_calibrating = False
+    habit_detector = _NullHabitDetector()
+    screen_overlay = _NullScreenOverlay()
+
+    def get_current_frame(self):
+        return (None, None, 0)
+
+_NULL_CAMERA = _NullCamera()
 
 class HabitKickerGUI(QMainWindow):
     def __init__(self):
@@ -19,6 +74,7 @@ class HabitKickerGUI(QMainWindow):
         self.base_dir = os.getcwd()
         self.data_dir = os.path.join(self.base_dir, "data")
         self.sounds_dir = os.path.join(self.base_dir, "sounds")
+        self._settings_path = os.path.join(self.data_dir, "habitkicker_settings.json")
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.sounds_dir, exist_ok=True)
 
@@ -45,24 +101,25 @@ class HabitKickerGUI(QMainWindow):
         self.tray_icon.activated.connect(self.tray_icon_clicked)
 
         # Default settings
-        self.default_settings = {
-            "nail_distance": 20,
-            "hair_distance": 110,
-            "nail_detection": True,
-            "hair_detection": True,
-            "slouch_detection": True,
-            "show_notifications": True,
-            "show_screen_outline": True,
-            "show_red_tint": True,
-            "alarm_volume": 15,
-            "camera_fps": 2
-        }
+        self.default_settings = Settings()
         
         # Current settings
         self.settings = self.load_settings()
         
-        # Initialize camera as None - we'll create it when needed
-        self.camera = None
+        # Debounce settings writes so dragging a slider doesn't rewrite the file on every tick
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        # GUI-thread timers and animations connect directly; only the camera's signals cross threads
+        self._save_timer.timeout.connect(self._flush_settings, Qt.ConnectionType.DirectConnection)
+        
+        # No camera until the application is started - we'll create it when needed
+        self.camera = _NULL_CAMERA
+        self._camera = None  # Created on first start and kept (paused) across stop/start cycles
+        
+        # State saved by calibrate_posture and restored once calibration ends
+        self.temp_enable_slouch_detection = False
+        self.temp_panel_expanded = False
         self.camera_thread = None
         
         # Set up the UI
@@ -74,13 +131,31 @@ class HabitKickerGUI(QMainWindow):
         # Camera panel state
         self.panel_expanded = False
         
-        # Timer for updating camera feed
-        self.camera_timer = QTimer()
-        self.camera_timer.timeout.connect(self.update_camera_feed)
-        self.camera_timer.start(33)  # Max ~30 fps
+        # Id of the last camera frame drawn in the panel
+        self._last_drawn_id = -1
+        
+        # Camera feed repaints are paced to the screen refresh rate (at least 30 Hz)
+        screen = QApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 60.0
+        self._feed_period = 1.0 / max(30.0, refresh_rate)
+        self._last_feed_ts = 0.0
+        # One reusable single-shot timer for deferred camera feed updates
+        self._feed_timer = QTimer(self)
+        self._feed_timer.setSingleShot(True)
+        self._feed_timer.timeout.connect(self.update_camera_feed, Qt.ConnectionType.DirectConnection)
+        # Restarted on every resize event so a burst of resizes ends in a single camera feed update
+        self._resize_debounce = QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.timeout.connect(self.update_camera_feed, Qt.ConnectionType.DirectConnection)
+        
+        # Whether hiding the calibration status frame is already scheduled
+        self._calib_hide_pending = False
+        # Whether closing the panel after calibration is already scheduled
+        self._panel_close_pending = False
 
-        # Automatically start the application
-        self.start_application()
+        # Automatically start the application once the event loop runs, so the window paints
+        # before the camera, MediaPipe and OpenCV modules are imported and loaded
+        QTimer.singleShot(0, self.start_application)
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -113,17 +188,17 @@ class HabitKickerGUI(QMainWindow):
         self.panel_bar = QFrame()
         self.panel_bar.setFixedWidth(25)
         self.panel_bar.setMinimumHeight(window_height)
-        self.panel_bar.setStyleSheet("""
-            background-color: #333333; 
-            border-right: 1px solid #555555;
-        """)
+        self.panel_bar.setObjectName("panelBar")
         self.panel_bar.setCursor(Qt.CursorShape.PointingHandCursor)
         self.panel_bar.mousePressEvent = self.toggle_panel
         
         # Add arrow indicator to the panel bar
-        self.arrow_label = QLabel("▶")  # Right-pointing arrow
+        # Both arrows are pre-rendered so toggling the panel only swaps pixmaps
+        self._arrow_right_pix = self._render_arrow("▶")  # Right-pointing arrow
+        self._arrow_left_pix = self._render_arrow("◀")  # Left-pointing arrow
+        self.arrow_label = QLabel()
+        self.arrow_label.setPixmap(self._arrow_right_pix)
         self.arrow_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.arrow_label.setStyleSheet("color: #AAAAAA; font-size: 15px;")
         self.arrow_label.setFixedSize(25, 25)
         
         # Create a vertical layout for the panel bar
@@ -133,123 +208,7 @@ class HabitKickerGUI(QMainWindow):
         panel_bar_layout.addWidget(self.arrow_label)
         
         # Create camera panel content
-        self.camera_panel_content = QWidget()
-        camera_panel_layout = QVBoxLayout(self.camera_panel_content)
-        camera_panel_layout.setContentsMargins(10, 0, 0, 22) # No margin on right border
-        camera_panel_layout.setSpacing(16)
-        camera_panel_layout.setAlignment(Qt.AlignmentFlag.AlignTop)  # Align contents to top
-        
-        # Add camera panel header
-        camera_header = QLabel("Camera Feed")
-        camera_header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        camera_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        camera_header.setStyleSheet("""
-            color: #FFFFFF;
-            margin-top: 42px;
-            margin-bottom: 22px;
-        """)
-        camera_panel_layout.addWidget(camera_header)
-        
-        # Add separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setFrameShadow(QFrame.Shadow.Sunken)
-        camera_panel_layout.addWidget(separator)
-        
-        # Create camera view widget
-        self.camera_view = QLabel()
-        self.camera_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.camera_view.setFixedSize(635, 413)
-        self.camera_view.setStyleSheet("""
-            background-color: #222222;
-            border: 1px solid #444444;
-            border-radius: 4px;
-            padding: 2px;
-        """)
-        self.camera_view.setText("Camera feed will appear here")
-        camera_panel_layout.addWidget(self.camera_view)
-        
-        # Add calibration status section at the bottom of camera panel
-        self.calibration_status_frame = QFrame()
-        self.calibration_status_frame.setFixedHeight(80)  # Set fixed height
-        self.calibration_status_frame.setStyleSheet("""
-            background-color: #333333;
-            padding: 5px;
-        """)
-        calibration_status_layout = QVBoxLayout(self.calibration_status_frame)
-        calibration_status_layout.setContentsMargins(10, 5, 10, 5)
-        calibration_status_layout.setSpacing(5)
-        
-        # Add calibration message label
-        self.calibration_message = QLabel("No calibration in progress")
-        self.calibration_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.calibration_message.setStyleSheet("color: #FFFFFF; font-size: 12px;")
-        calibration_status_layout.addWidget(self.calibration_message)
-        
-        # Add progress bar for calibration
-        self.calibration_progress = QProgressBar()
-        self.calibration_progress.setRange(0, 100)
-        self.calibration_progress.setValue(0)
-        self.calibration_progress.setTextVisible(True)
-        self.calibration_progress.setFixedHeight(25)
-        self.calibration_progress.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 3px;
-                background-color: #222222;
-                text-align: center;
-                color: white;
-                font-size: 10px;
-            }
-            QProgressBar::chunk {
-                background-color: #00AA00;
-                border-radius: 2px;
-            }
-        """)
-        calibration_status_layout.addWidget(self.calibration_progress)
-        
-        # Hide by default
-        self.calibration_status_frame.setVisible(False)
-        
-        # Add to camera panel layout
-        camera_panel_layout.addWidget(self.calibration_status_frame)
-        
-        # Add camera delay slider
-        delay_frame = QFrame()
-        delay_frame.setStyleSheet("""
-            background-color: #333333;
-            padding: 5px;
-        """)
-        delay_frame.setFixedHeight(50)
-        delay_layout = QVBoxLayout(delay_frame)
-        delay_layout.setContentsMargins(10, 10, 10, 10)
-        delay_layout.setSpacing(10)
-        
-        # Add delay slider controls
-        delay_controls = QHBoxLayout()
-        delay_label = QLabel("Camera FPS:")
-        self.delay_label = delay_label  # Store reference to label
-        self.delay_slider = QSlider(Qt.Orientation.Horizontal)
-        self.delay_slider.setRange(1, 30)  # 1 to 30 FPS
-        initial_fps = self.settings["camera_fps"]
-        self.delay_slider.setValue(initial_fps)
-        self.delay_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.delay_slider.setTickInterval(5)
-        self.delay_value_label = QLabel(f"{initial_fps} FPS")
-        
-        delay_controls.addWidget(delay_label)
-        delay_controls.addWidget(self.delay_slider)
-        delay_controls.addWidget(self.delay_value_label)
-        delay_layout.addLayout(delay_controls)
-        
-        # Connect delay slider
-        self.delay_slider.valueChanged.connect(self.update_delay_value)
-        
-        # Add to camera panel layout
-        camera_panel_layout.addWidget(delay_frame)
-        
-        # Add stretch at the bottom to push everything up
-        camera_panel_layout.addStretch()
+        self._build_camera_panel_content()
         
         # Add widgets to panel layout
         panel_layout.addWidget(self.panel_bar)
@@ -298,6 +257,7 @@ class HabitKickerGUI(QMainWindow):
         
         # Calibration status
         self.calibration_status = QLabel("Status: Not calibrated")
+        self._last_calib_status = "Status: Not calibrated"  # Text currently shown, to skip redundant setText calls
         calibration_layout.addWidget(self.calibration_status)
         
         main_layout.addWidget(calibration_frame)
@@ -310,10 +270,10 @@ class HabitKickerGUI(QMainWindow):
         nail_label = QLabel("Max Nail Distance:")
         self.nail_slider = QSlider(Qt.Orientation.Horizontal)
         self.nail_slider.setRange(0, 100)
-        self.nail_slider.setValue(self.settings["nail_distance"])  # Use saved value
+        self.nail_slider.setValue(self.settings.nail_distance)  # Use saved value
         self.nail_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.nail_slider.setTickInterval(10)
-        self.nail_value_label = QLabel(str(self.settings["nail_distance"]))
+        self.nail_value_label = QLabel(str(self.settings.nail_distance))
         
         nail_layout.addWidget(nail_label)
         nail_layout.addWidget(self.nail_slider)
@@ -325,10 +285,10 @@ class HabitKickerGUI(QMainWindow):
         hair_label = QLabel("Max Hair Distance:")
         self.hair_slider = QSlider(Qt.Orientation.Horizontal)
         self.hair_slider.setRange(0, 150)
-        self.hair_slider.setValue(self.settings["hair_distance"])  # Use saved value
+        self.hair_slider.setValue(self.settings.hair_distance)  # Use saved value
         self.hair_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.hair_slider.setTickInterval(10)
-        self.hair_value_label = QLabel(str(self.settings["hair_distance"]))
+        self.hair_value_label = QLabel(str(self.settings.hair_distance))
         
         hair_layout.addWidget(hair_label)
         hair_layout.addWidget(self.hair_slider)
@@ -343,7 +303,7 @@ class HabitKickerGUI(QMainWindow):
         nail_toggle_layout = QHBoxLayout()
         nail_toggle_label = QLabel("Nail Biting:")
         self.nail_toggle = QCheckBox()
-        self.nail_toggle.setChecked(self.settings["nail_detection"])
+        self.nail_toggle.setChecked(self.settings.nail_detection)
         self.nail_toggle.stateChanged.connect(self.toggle_nail_detection)
         nail_toggle_layout.addWidget(nail_toggle_label)
         nail_toggle_layout.addWidget(self.nail_toggle)
@@ -353,7 +313,7 @@ class HabitKickerGUI(QMainWindow):
         hair_toggle_layout = QHBoxLayout()
         hair_toggle_label = QLabel("Hair Pulling:")
         self.hair_toggle = QCheckBox()
-        self.hair_toggle.setChecked(self.settings["hair_detection"])
+        self.hair_toggle.setChecked(self.settings.hair_detection)
         self.hair_toggle.stateChanged.connect(self.toggle_hair_detection)
         hair_toggle_layout.addWidget(hair_toggle_label)
         hair_toggle_layout.addWidget(self.hair_toggle)
@@ -363,7 +323,7 @@ class HabitKickerGUI(QMainWindow):
         slouch_toggle_layout = QHBoxLayout()
         slouch_toggle_label = QLabel("Slouching:")
         self.slouch_toggle = QCheckBox()
-        self.slouch_toggle.setChecked(self.settings["slouch_detection"])
+        self.slouch_toggle.setChecked(self.settings.slouch_detection)
         self.slouch_toggle.stateChanged.connect(self.toggle_slouch_detection)
         slouch_toggle_layout.addWidget(slouch_toggle_label)
         slouch_toggle_layout.addWidget(self.slouch_toggle)
@@ -383,8 +343,8 @@ class HabitKickerGUI(QMainWindow):
         detection_layout.addLayout(restore_layout)
         
         # Connect sliders to update functions
-        self.nail_slider.valueChanged.connect(self.update_nail_value)
-        self.hair_slider.valueChanged.connect(self.update_hair_value)
+        self.nail_slider.valueChanged.connect(partial(self._on_slider, "nail_distance"))
+        self.hair_slider.valueChanged.connect(partial(self._on_slider, "hair_distance"))
         
         main_layout.addWidget(detection_frame)
         
@@ -395,7 +355,7 @@ class HabitKickerGUI(QMainWindow):
         notification_layout = QHBoxLayout()
         notification_label = QLabel("Show Notifications (1s):")
         self.notification_checkbox = QCheckBox()
-        self.notification_checkbox.setChecked(self.settings["show_notifications"])  # Use saved value
+        self.notification_checkbox.setChecked(self.settings.show_notifications)  # Use saved value
         self.notification_checkbox.stateChanged.connect(self.toggle_notifications)
         
         notification_layout.addWidget(notification_label)
@@ -407,7 +367,7 @@ class HabitKickerGUI(QMainWindow):
         outline_layout = QHBoxLayout()
         outline_label = QLabel("Show Screen Outline (1s):")
         self.outline_checkbox = QCheckBox()
-        self.outline_checkbox.setChecked(self.settings["show_screen_outline"])  # Use saved value
+        self.outline_checkbox.setChecked(self.settings.show_screen_outline)  # Use saved value
         self.outline_checkbox.stateChanged.connect(self.toggle_screen_outline)
         
         outline_layout.addWidget(outline_label)
@@ -419,7 +379,7 @@ class HabitKickerGUI(QMainWindow):
         tint_layout = QHBoxLayout()
         tint_label = QLabel("Show Tint (3s):")
         self.tint_checkbox = QCheckBox()
-        self.tint_checkbox.setChecked(self.settings["show_red_tint"])  # Use saved value
+        self.tint_checkbox.setChecked(self.settings.show_red_tint)  # Use saved value
         self.tint_checkbox.stateChanged.connect(self.toggle_tint)
         
         tint_layout.addWidget(tint_label)
@@ -433,13 +393,13 @@ class HabitKickerGUI(QMainWindow):
         self.volume_label = volume_label  # Store reference to label
         self.volume_slider = QSlider(Qt.Orientation.Horizontal)
         self.volume_slider.setRange(0, 100)
-        self.volume_slider.setValue(self.settings["alarm_volume"])  # Use saved value
+        self.volume_slider.setValue(self.settings.alarm_volume)  # Use saved value
         self.volume_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.volume_slider.setTickInterval(10)
-        self.volume_value_label = QLabel(f"{self.settings['alarm_volume']}%")
+        self.volume_value_label = QLabel(f"{self.settings.alarm_volume}%")
         
         # Set initial enabled state based on tint setting
-        show_tint = self.settings["show_red_tint"]
+        show_tint = self.settings.show_red_tint
         self.volume_slider.setEnabled(show_tint)
         self.volume_value_label.setEnabled(show_tint)
         self.volume_label.setEnabled(show_tint)
@@ -450,7 +410,7 @@ class HabitKickerGUI(QMainWindow):
         alert_layout.addLayout(volume_layout)
         
         # Connect volume slider
-        self.volume_slider.valueChanged.connect(self.update_volume_value)
+        self.volume_slider.valueChanged.connect(partial(self._on_slider, "alarm_volume"))
         
         main_layout.addWidget(alert_frame)
         
@@ -463,161 +423,390 @@ class HabitKickerGUI(QMainWindow):
         self.start_button.clicked.connect(self.toggle_application)
         main_layout.addWidget(self.start_button)
         
+        # One stylesheet for the whole window, so Qt parses and polishes it once
+        # "#name *" keeps the old behaviour of a frame's style also applying to its children
+        self.setStyleSheet("""
+            #panelBar, #panelBar * {
+                background-color: #333333;
+                border-right: 1px solid #555555;
+            }
+            #cameraHeader {
+                color: #FFFFFF;
+                margin-top: 42px;
+                margin-bottom: 22px;
+            }
+            #cameraView {
+                background-color: #222222;
+                border: 1px solid #444444;
+                border-radius: 4px;
+                padding: 2px;
+            }
+            #calibrationStatusFrame, #calibrationStatusFrame *,
+            #delayFrame, #delayFrame * {
+                background-color: #333333;
+                padding: 5px;
+            }
+            QLabel#calibrationMessage {
+                color: #FFFFFF;
+                font-size: 12px;
+            }
+            QProgressBar#calibrationProgress {
+                border: 1px solid #555555;
+                border-radius: 3px;
+                background-color: #222222;
+                text-align: center;
+                color: white;
+                font-size: 10px;
+            }
+            QProgressBar#calibrationProgress::chunk {
+                background-color: #00AA00;
+                border-radius: 2px;
+            }
+        """)
+        
+        # Slider handling: settings key -> (value label, label format, extra action for the camera)
+        self._slider_specs = {
+            "nail_distance": (self.nail_value_label, "{}", None),
+            "hair_distance": (self.hair_value_label, "{}", None),
+            "alarm_volume": (self.volume_value_label, "{}%", self._apply_alarm_volume),
+            "camera_fps": (self.delay_value_label, "{} FPS", self._apply_camera_fps),
+        }
+        
         # Set up animations
         self.panel_animation = QPropertyAnimation(self.panel_widget, b"minimumWidth")
         self.panel_animation.setDuration(250)
         self.panel_animation.setEasingCurve(QEasingCurve.Type.Linear)
+        # Forward expands the panel, backward collapses it
+        self.panel_animation.setStartValue(25)
+        self.panel_animation.setEndValue(670)
+        self.panel_animation.finished.connect(self._on_panel_animation_finished, Qt.ConnectionType.DirectConnection)
+
+    def _build_camera_panel_content(self):
+        """Build the slide-out camera panel content (camera view, calibration status and FPS slider)"""
+        self.camera_panel_content = QWidget()
+        camera_panel_layout = QVBoxLayout(self.camera_panel_content)
+        camera_panel_layout.setContentsMargins(10, 0, 0, 22) # No margin on right border
+        camera_panel_layout.setSpacing(16)
+        camera_panel_layout.setAlignment(Qt.AlignmentFlag.AlignTop)  # Align contents to top
+        
+        # Add camera panel header
+        camera_header = QLabel("Camera Feed")
+        camera_header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        camera_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        camera_header.setObjectName("cameraHeader")
+        camera_panel_layout.addWidget(camera_header)
+        
+        # Add separator
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        camera_panel_layout.addWidget(separator)
+        
+        # Create camera view widget
+        self.camera_view = QLabel()
+        self.camera_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.camera_view.setFixedSize(635, 413)
+        self.camera_view.setObjectName("cameraView")
+        self.camera_view.setText("Camera feed will appear here")
+        self.camera_view.setScaledContents(False)  # Frames are pre-scaled by the camera thread
+        camera_panel_layout.addWidget(self.camera_view)
+        
+        # Pre-render the placeholder messages so state changes only swap pixmaps
+        self._placeholder_not_init_pix = self._render_placeholder("Camera not initialized")
+        self._placeholder_not_avail_pix = self._render_placeholder("Camera feed not available")
+        self._last_view_state = None  # "frame", "not_initialized" or "not_available"
+        
+        # Add calibration status section at the bottom of camera panel
+        self.calibration_status_frame = QFrame()
+        self.calibration_status_frame.setFixedHeight(80)  # Set fixed height
+        self.calibration_status_frame.setObjectName("calibrationStatusFrame")
+        calibration_status_layout = QVBoxLayout(self.calibration_status_frame)
+        calibration_status_layout.setContentsMargins(10, 5, 10, 5)
+        calibration_status_layout.setSpacing(5)
+        
+        # Add calibration message label
+        self.calibration_message = QLabel("No calibration in progress")
+        self.calibration_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.calibration_message.setObjectName("calibrationMessage")
+        calibration_status_layout.addWidget(self.calibration_message)
+        
+        # Add progress bar for calibration
+        self.calibration_progress = QProgressBar()
+        self.calibration_progress.setRange(0, 100)
+        self.calibration_progress.setValue(0)
+        self.calibration_progress.setTextVisible(True)
+        self.calibration_progress.setFixedHeight(25)
+        self.calibration_progress.setObjectName("calibrationProgress")
+        calibration_status_layout.addWidget(self.calibration_progress)
+        
+        # Last (message, style, progress) shown, so unchanged values aren't pushed to Qt again
+        self._last_calib_state = ("No calibration in progress", "color: #FFFFFF; font-size: 12px;", 0)
+        
+        # Hide by default
+        self.calibration_status_frame.setVisible(False)
+        
+        # Add to camera panel layout
+        camera_panel_layout.addWidget(self.calibration_status_frame)
+        
+        # Add camera delay slider
+        delay_frame = QFrame()
+        delay_frame.setObjectName("delayFrame")
+        delay_frame.setFixedHeight(50)
+        delay_layout = QVBoxLayout(delay_frame)
+        delay_layout.setContentsMargins(10, 10, 10, 10)
+        delay_layout.setSpacing(10)
+        
+        # Add delay slider controls
+        delay_controls = QHBoxLayout()
+        delay_label = QLabel("Camera FPS:")
+        self.delay_label = delay_label  # Store reference to label
+        self.delay_slider = QSlider(Qt.Orientation.Horizontal)
+        self.delay_slider.setRange(1, 30)  # 1 to 30 FPS
+        initial_fps = self.settings.camera_fps
+        self.delay_slider.setValue(initial_fps)
+        self.delay_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
+        self.delay_slider.setTickInterval(5)
+        self.delay_value_label = QLabel(f"{initial_fps} FPS")
+        
+        delay_controls.addWidget(delay_label)
+        delay_controls.addWidget(self.delay_slider)
+        delay_controls.addWidget(self.delay_value_label)
+        delay_layout.addLayout(delay_controls)
+        
+        # Connect delay slider
+        self.delay_slider.valueChanged.connect(partial(self._on_slider, "camera_fps"))
+        
+        # Add to camera panel layout
+        camera_panel_layout.addWidget(delay_frame)
+        
+        # Add stretch at the bottom to push everything up
+        camera_panel_layout.addStretch()
 
     def toggle_panel(self, event=None):
         """Toggle the camera panel expansion state"""
-        if self.panel_expanded:
-            # Collapse panel
-            self.panel_animation.setStartValue(670)
-            self.panel_animation.setEndValue(25)
+        self._set_panel(not self.panel_expanded)
+    
+    def _set_panel(self, expanded):
+        """Expand or collapse the camera panel; does nothing if it is already in (or heading to) that state"""
+        if expanded == self.panel_expanded:
+            return
+        
+        if not expanded:
+            # Collapse panel (content is hidden once the animation finishes)
+            self.panel_animation.setDirection(QAbstractAnimation.Direction.Backward)
             self.panel_expanded = False
-            self.arrow_label.setText("▶")  # Right-pointing arrow
-            # Hide camera panel content
-            self.camera_panel_content.setVisible(False)
+            self.arrow_label.setPixmap(self._arrow_right_pix)
+            # The camera no longer needs to publish frames for display
+            self.camera.display_enabled = False
         else:
             # Expand panel
-            self.panel_animation.setStartValue(25)
-            self.panel_animation.setEndValue(670)
+            self.panel_animation.setDirection(QAbstractAnimation.Direction.Forward)
             self.panel_expanded = True
-            self.arrow_label.setText("◀")  # Left-pointing arrow
+            self.arrow_label.setPixmap(self._arrow_left_pix)
             # Show camera panel content
             self.camera_panel_content.setVisible(True)
+            self.camera.display_enabled = True
             # Update camera feed immediately when expanded
             self.update_camera_feed()
         
-        self.panel_animation.start()
+        # A running animation just reverses in place when its direction changes
+        if self.panel_animation.state() != QAbstractAnimation.State.Running:
+            self.panel_animation.start()
+    
+    def _on_panel_animation_finished(self):
+        """Hide the camera panel content after the collapse animation so it doesn't relayout mid-slide"""
+        if not self.panel_expanded:
+            self.camera_panel_content.setVisible(False)
     
     def update_camera_feed(self):
-        """Update the camera feed in the panel"""
+        """Update the camera feed in the panel with the camera's latest frame"""
+        now = time.monotonic()
+        wait = self._last_feed_ts + self._feed_period - now
+        if wait > 0:
+            # Too soon after the last repaint, draw whatever is newest once the period is up
+            self._schedule_camera_feed(int(wait * 1000) + 1)
+            return
+        self._last_feed_ts = now
+        
+        if self.camera.cap is not None:
+            self._show_frame(*self.camera.get_current_frame())
+        elif self.panel_expanded and self.camera_panel_content.isVisible():
+            self._set_placeholder("not_initialized", self._placeholder_not_init_pix)
+    
+    def _schedule_camera_feed(self, delay_ms):
+        """Schedule a single deferred camera feed update, coalescing repeated requests"""
+        if not self._feed_timer.isActive():
+            self._feed_timer.start(delay_ms)
+    
+    def _show_frame(self, frame, qt_image, frame_id):
+        """Display a frame published by the camera thread"""
         # Only update when panel is expanded and camera view is visible
         # or when calibration is in progress
-        is_calibrating = hasattr(self, 'camera') and self.camera is not None and self.camera.is_calibrating
+        is_calibrating = self.camera.is_calibrating
         
         if (not self.panel_expanded or not self.camera_panel_content.isVisible()) and not is_calibrating:
             return
+        
+        # Skip the redraw if this frame has already been drawn (stale notifications end up here)
+        if frame_id == self._last_drawn_id:
+            return
             
-        if hasattr(self, 'camera') and self.camera is not None and self.camera.cap is not None:
-            # Get the current frame from the camera
-            frame = self.camera.get_current_frame()
-            if frame is not None:
-                try:
-                    # Convert the OpenCV BGR image to RGB for Qt
-                    rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    h, w, ch = rgb_image.shape
-                    
-                    # Convert to QImage and then to QPixmap
-                    qt_image = QImage(rgb_image.data, w, h, w * ch, QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qt_image)
-                    
-                    # Scale pixmap to fit the label while maintaining aspect ratio
-                    self.camera_view.setPixmap(pixmap.scaled(
+        if frame is not None:
+            try:
+                pixmap = QPixmap.fromImage(qt_image)
+                self._last_drawn_id = frame_id
+                
+                # Frames are pre-scaled by the camera thread; only scale here if the view size changed since
+                if pixmap.width() > self.camera_view.width() or pixmap.height() > self.camera_view.height():
+                    pixmap = pixmap.scaled(
                         self.camera_view.width(), 
                         self.camera_view.height(),
-                        Qt.AspectRatioMode.KeepAspectRatio
-                    ))
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.FastTransformation  # Smooth scaling isn't worth it for a live preview
+                    )
+                self.camera_view.setPixmap(pixmap)
+                self._last_view_state = "frame"
+                
+                # If calibrating and panel is not expanded, expand it to show the calibration
+                if is_calibrating:
+                    self._set_panel(True)
                     
-                    # Update calibration status if camera is calibrating
-                    if is_calibrating:
-                        self.update_calibration_status()
-                        
-                    # If calibrating and panel is not expanded, expand it to show the calibration
-                    if is_calibrating and not self.panel_expanded:
-                        self.toggle_panel()
-                        
-                except Exception as e:
-                    print(f"Error updating camera feed: {e}")
-            else:
-                self.camera_view.setText("Camera feed not available")
+            except Exception:
+                log.exception("Error updating camera feed")
         else:
-            self.camera_view.setText("Camera not initialized")
+            self._set_placeholder("not_available", self._placeholder_not_avail_pix)
+    
+    def _render_placeholder(self, text):
+        """Render a placeholder message into a transparent pixmap using the camera view's font and color"""
+        font = self.camera_view.font()
+        size = QFontMetrics(font).boundingRect(text).size()
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(self.camera_view.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pixmap
+    
+    def _render_arrow(self, arrow):
+        """Render a panel arrow glyph into a transparent 25x25 pixmap"""
+        font = QFont()
+        font.setPixelSize(15)
+        pixmap = QPixmap(25, 25)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor("#AAAAAA"))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, arrow)
+        painter.end()
+        return pixmap
+    
+    def _set_placeholder(self, state, pixmap):
+        """Show a placeholder pixmap in the camera view if it isn't already showing"""
+        if self._last_view_state != state:
+            self.camera_view.setPixmap(pixmap)
+            self._last_view_state = state
     
-    def update_calibration_status(self):
-        """Update the calibration status in the panel"""
-        if not hasattr(self, 'camera') or self.camera is None:
+    def update_calibration_status(self, progress, message):
+        """Show the calibration countdown or progress reported by the camera thread"""
+        if self.camera is _NULL_CAMERA:
             return
-            
-        # Show the calibration status frame
-        self.calibration_status_frame.setVisible(True)
         
-        # Get calibration info from the camera/slouch_detector
-        if self.camera.is_calibrating:
-            # Check if in countdown phase
-            if self.camera.slouch_detector.calibration_countdown > 0:
-                current_time = time.time()
-                elapsed = current_time - self.camera.slouch_detector.calibration_start_time
-                remaining = self.camera.slouch_detector.calibration_countdown - elapsed
-                
-                if remaining > 0:
-                    # Update countdown message
-                    self.calibration_message.setText(f"Calibration in {int(remaining)+1}...")
-                    self.calibration_message.setStyleSheet("color: #00FF00; font-size: 14px; font-weight: bold;")
-                    self.calibration_progress.setValue(0)
-                
-            else:
-                # In actual calibration phase
-                current_time = time.time()
-                elapsed = current_time - self.camera.slouch_detector.calibration_start_time
-                duration = self.camera.slouch_detector.calibration_duration
-                
-                if elapsed < duration:
-                    # Calculate progress percentage
-                    progress = int((elapsed / duration) * 100)
-                    
-                    # Update UI
-                    self.calibration_message.setText("Calibrating posture... Stay still and sit up straight!")
-                    self.calibration_message.setStyleSheet("color: #00FF00; font-size: 14px; font-weight: bold;")
-                    self.calibration_progress.setValue(progress)
-        
-        # Check if calibration just completed
-        elif hasattr(self.camera, 'calibration_complete_time'):
-            current_time = time.time()
-            if current_time - self.camera.calibration_complete_time < 2:
-                # Show completion message
-                self.calibration_message.setText("Calibration Complete!")
-                self.calibration_message.setStyleSheet("color: #00FF00; font-size: 14px; font-weight: bold;")
-                self.calibration_progress.setValue(100)
-            # Hide the calibration status after the completion message duration
-            time.sleep(1)
+        self.calibration_status_frame.setVisible(True)
+        self._set_calibration_state(message, "color: #00FF00; font-size: 14px; font-weight: bold;", progress)
+    
+    def _on_calibration_done(self, success):
+        """Show the calibration result once the camera thread reports that calibration has ended"""
+        if self.camera is _NULL_CAMERA:
             self.calibration_status_frame.setVisible(False)
+            return
         
+        if success:
+            # Show completion message
+            self.calibration_status_frame.setVisible(True)
+            self._set_calibration_state(
+                "Calibration Complete!",
+                "color: #00FF00; font-size: 14px; font-weight: bold;",
+                100
+            )
+            # Hide the calibration status after the completion message duration without blocking the GUI
+            if not self._calib_hide_pending:
+                self._calib_hide_pending = True
+                QTimer.singleShot(1000, self._hide_calibration_status)
         else:
-            # No calibration activity, hide the frame
             self.calibration_status_frame.setVisible(False)
+        
+        self.check_calibration_status()
+    
+    def _set_calibration_state(self, message, style, progress):
+        """Update the calibration message, its style and the progress bar, skipping unchanged values
+        
+        Args:
+            message: Calibration message text
+            style: Stylesheet for the message, or None to keep the current one
+            progress: Progress bar value (0-100)
+        """
+        last_message, last_style, last_progress = self._last_calib_state
+        if message != last_message:
+            self.calibration_message.setText(message)
+        if style is not None and style != last_style:
+            # setStyleSheet re-polishes the widget, so only call it on an actual change
+            self.calibration_message.setStyleSheet(style)
+        else:
+            style = last_style
+        if progress != last_progress:
+            self.calibration_progress.setValue(progress)
+        self._last_calib_state = (message, style, progress)
+    
+    def _hide_calibration_status(self):
+        """Hide the calibration status frame once the completion message has been shown"""
+        self._calib_hide_pending = False
+        self.calibration_status_frame.setVisible(False)
     
     def load_settings(self):
         """Load settings from file"""
-        settings_path = os.path.join(self.data_dir, "habitkicker_settings.json")
         try:
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    return json.load(f)
-            return self.default_settings.copy()
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-            return self.default_settings.copy()
+            with open(self._settings_path, 'rb') as f:
+                data = orjson.loads(f.read())
+            # Ignore keys this version doesn't know; keys missing from the file keep their defaults
+            return Settings(**{k: v for k, v in data.items() if k in Settings.__dataclass_fields__})
+        except FileNotFoundError:
+            return Settings()
+        except Exception:
+            log.exception("Error loading settings")
+            return Settings()
     
     def save_settings(self):
         """Save settings to file"""
-        settings_path = os.path.join(self.data_dir, "habitkicker_settings.json")
+        temp_path = self._settings_path + ".tmp"
         try:
-            with open(settings_path, 'w') as f:
-                json.dump(self.settings, f)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+            # Write to a temporary file and swap it in so the settings file is never half-written
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(self.settings))
+            os.replace(temp_path, self._settings_path)
+        except Exception:
+            log.exception("Error saving settings")
+    
+    def _flush_settings(self):
+        """Write settings changes batched by the save timer and push thresholds to the detector"""
+        self._save_timer.stop()
+        self.save_settings()
+        
+        # Update camera if running
+        self.camera.habit_detector.update_thresholds(self.settings.nail_distance, self.settings.hair_distance)
     
     def restore_default_detection_settings(self):
         """Restore detection settings to default values"""
         # Update sliders
-        self.nail_slider.setValue(self.default_settings["nail_distance"])
-        self.hair_slider.setValue(self.default_settings["hair_distance"])
+        self.nail_slider.setValue(self.default_settings.nail_distance)
+        self.hair_slider.setValue(self.default_settings.hair_distance)
         
         # Update settings
-        self.settings["nail_distance"] = self.default_settings["nail_distance"]
-        self.settings["hair_distance"] = self.default_settings["hair_distance"]
+        self.settings.nail_distance = self.default_settings.nail_distance
+        self.settings.hair_distance = self.default_settings.hair_distance
         
         # Update detection toggles
         self.nail_toggle.setChecked(True)
@@ -625,20 +814,17 @@ class HabitKickerGUI(QMainWindow):
         self.slouch_toggle.setChecked(True)
         
         # Update settings for detection toggles
-        self.settings["nail_detection"] = True
-        self.settings["hair_detection"] = True
-        self.settings["slouch_detection"] = True
+        self.settings.nail_detection = True
+        self.settings.hair_detection = True
+        self.settings.slouch_detection = True
         
         # Save settings
-        self.save_settings()
+        self._save_timer.start()
         
-        # Update camera if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.habit_detector.NAIL_PULLING_THRESHOLD = self.default_settings["nail_distance"]
-            self.camera.habit_detector.HAIR_PULLING_THRESHOLD = self.default_settings["hair_distance"]
-            self.camera.enable_nail_detection = True
-            self.camera.enable_hair_detection = True
-            self.camera.enable_slouch_detection = True
+        # Update camera if running (thresholds are pushed when the settings are flushed)
+        self.camera.enable_nail_detection = True
+        self.camera.enable_hair_detection = True
+        self.camera.enable_slouch_detection = True
         
     def create_section_frame(self, title):
         """Create a framed section with title"""
@@ -664,93 +850,67 @@ class HabitKickerGUI(QMainWindow):
         
         return frame, layout
         
-    def update_nail_value(self, value):
-        """Update the nail biting distance value label"""
-        self.nail_value_label.setText(str(value))
+    def _on_slider(self, key, value):
+        """Update a slider's value label and setting (detection thresholds are pushed on settings flush)"""
+        label, label_format, apply = self._slider_specs[key]
+        label.setText(label_format.format(value))
         # Update settings
-        self.settings["nail_distance"] = value
-        self.save_settings()
+        setattr(self.settings, key, value)
+        self._save_timer.start()
         # Update camera if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.habit_detector.NAIL_PULLING_THRESHOLD = value
-        
-    def update_hair_value(self, value):
-        """Update the hair pulling distance value label"""
-        self.hair_value_label.setText(str(value))
-        # Update settings
-        self.settings["hair_distance"] = value
-        self.save_settings()
-        # Update camera if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.habit_detector.HAIR_PULLING_THRESHOLD= value
-        
-    def update_volume_value(self, value):
-        """Update the volume value label"""
-        self.volume_value_label.setText(f"{value}%")
-        # Update settings
-        self.settings["alarm_volume"] = value
-        self.save_settings()
-
-        # Update volume in screen outline if available
-        if hasattr(self, 'camera') and self.camera and hasattr(self.camera, 'screen_overlay'):
-            # Convert percentage to a value between 0 and 1
-            volume = value / 100.0
-            self.camera.screen_overlay.alarm_volume = volume
-            # Update the sound volume if it exists
-            if hasattr(self.camera.screen_overlay, 'alarm_sound') and self.camera.screen_overlay.alarm_sound:
-                self.camera.screen_overlay.alarm_sound.set_volume(volume)
-                self.camera.screen_overlay.audio_initialized = True
+        if apply is not None:
+            apply(value)
     
-    def update_delay_value(self, value):
-        """Update the camera processing delay value label"""
-        self.delay_value_label.setText(f"{value} FPS")
-        # Update settings
-        self.settings["camera_fps"] = value
-        self.save_settings()
-        # Update camera delay if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.processing_delay = 1.0 / value  # Convert FPS directly to seconds
+    def _apply_alarm_volume(self, value):
+        """Update the alarm volume in the screen overlay"""
+        # Convert percentage to a value between 0 and 1
+        volume = value / 100.0
+        self.camera.screen_overlay.alarm_volume = volume
+        # Update the sound volume if it exists
+        if self.camera.screen_overlay.alarm_sound:
+            self.camera.screen_overlay.alarm_sound.set_volume(volume)
+            self.camera.screen_overlay.audio_initialized = True
+    
+    def _apply_camera_fps(self, value):
+        """Update the camera processing delay"""
+        self.camera.processing_delay = 1.0 / value  # Convert FPS directly to seconds
     
     def toggle_notifications(self, state):
         """Toggle notifications on/off"""
         show_notifications = state == Qt.CheckState.Checked.value
         # Update settings
-        self.settings["show_notifications"] = show_notifications
-        self.save_settings()
+        self.settings.show_notifications = show_notifications
+        self._save_timer.start()
         
-        # Update notification settings in camera if applicable
-        if hasattr(self, 'camera') and self.camera is not None:
-            if hasattr(self.camera.screen_overlay, 'notification_visible'):
-                self.camera.screen_overlay.show_notification = show_notifications
-                # If notifications are disabled and a notification is currently visible, hide it
-                if not show_notifications and self.camera.screen_overlay.notification_window and self.camera.screen_overlay.notification_window.winfo_exists():
-                    self.camera.screen_overlay.notification_window.withdraw()
-            print(f"Notifications {'enabled' if show_notifications else 'disabled'}")
+        # Update notification settings in camera
+        overlay = self.camera.screen_overlay
+        overlay.show_notification = show_notifications
+        # If notifications are disabled, hide any notification that is currently visible (on the overlay's Tk thread)
+        if not show_notifications:
+            overlay.call_on_tk_thread(overlay.hide_notification)
+        log.info("Notifications %s", "enabled" if show_notifications else "disabled")
         
     def toggle_screen_outline(self, state):
         """Toggle screen outline on/off"""
         show_outline = state == Qt.CheckState.Checked.value
         # Update settings
-        self.settings["show_screen_outline"] = show_outline
-        self.save_settings()
+        self.settings.show_screen_outline = show_outline
+        self._save_timer.start()
         
         # Update screen outline settings
-        if hasattr(self, 'camera') and self.camera is not None:
-            # Set the property that controls whether outlines should be shown
-            self.camera.screen_overlay.show_outline_enabled = show_outline
-            # Update the outline transparency instead of hiding it
-            if not show_outline:
-                self.camera.screen_overlay.set_outline_transparency(0)
-            else:
-                self.camera.screen_overlay.set_outline_transparency(1)
-            print(f"Screen outline {'enabled' if show_outline else 'disabled'}")
+        # Set the property that controls whether outlines should be shown
+        overlay = self.camera.screen_overlay
+        overlay.show_outline_enabled = show_outline
+        # Update the outline transparency instead of hiding it
+        overlay.call_on_tk_thread(overlay.set_outline_transparency, 1 if show_outline else 0)
+        log.info("Screen outline %s", "enabled" if show_outline else "disabled")
 
     def toggle_tint(self, state):
         """Toggle tint on/off"""
         show_tint = state == Qt.CheckState.Checked.value
         # Update settings
-        self.settings["show_red_tint"] = show_tint
-        self.save_settings()
+        self.settings.show_red_tint = show_tint
+        self._save_timer.start()
         
         # Enable/disable volume controls based on tint state
         self.volume_slider.setEnabled(show_tint)
@@ -758,16 +918,15 @@ class HabitKickerGUI(QMainWindow):
         self.volume_label.setEnabled(show_tint)
         
         # Update tint settings
-        if hasattr(self, 'camera') and self.camera is not None:
-            # Add a show_tint property to the screen_overlay object
-            self.camera.screen_overlay.show_red_tint = show_tint
-            # If tint is currently showing and should be disabled, hide it
-            if not show_tint and self.camera.screen_overlay.is_tinted:
-                self.camera.screen_overlay.hide_tint()
-            # If tint should be enabled and we're already in red outline state, show it
-            elif show_tint and self.camera.screen_overlay.current_color == "red":
-                self.camera.screen_overlay.show_tint()
-            print(f"Tint {'enabled' if show_tint else 'disabled'}")
+        overlay = self.camera.screen_overlay
+        overlay.show_red_tint = show_tint
+        # If tint is currently showing and should be disabled, hide it
+        if not show_tint and overlay.is_tinted:
+            overlay.call_on_tk_thread(overlay.hide_tint)
+        # If tint should be enabled and we're already in red outline state, show it
+        elif show_tint and overlay.current_color == "red":
+            overlay.call_on_tk_thread(overlay.show_tint)
+        log.info("Tint %s", "enabled" if show_tint else "disabled")
     
     def toggle_camera_window(self):
         """Toggle the camera window visibility"""
@@ -775,7 +934,7 @@ class HabitKickerGUI(QMainWindow):
         
     def calibrate_posture(self):
         """Calibrate posture using the camera"""
-        if hasattr(self, 'camera') and self.camera is not None:
+        if self.camera is not _NULL_CAMERA:
             try:
                 # Temporarily enable slouch detection
                 self.temp_enable_slouch_detection = self.camera.enable_slouch_detection
@@ -783,91 +942,88 @@ class HabitKickerGUI(QMainWindow):
 
                 # Open the slide-out panel if it's not already open
                 self.temp_panel_expanded = self.panel_expanded
-                if not self.panel_expanded:
-                    self.toggle_panel()
+                self._set_panel(True)
                 
-                # Show calibration status panel
-                self.calibration_status_frame.setVisible(True)
-                self.calibration_message.setText("Preparing for calibration...")
-                self.calibration_progress.setValue(0)
+                # Show calibration status panel, batching the widget changes into one repaint
+                self.camera_panel_content.setUpdatesEnabled(False)
+                try:
+                    self.calibration_status_frame.setVisible(True)
+                    self._set_calibration_state("Preparing for calibration...", None, 0)
+                finally:
+                    self.camera_panel_content.setUpdatesEnabled(True)
                 
                 # Store current processing delay and set to 0 for calibration
                 self.camera.stored_processing_delay = self.camera.processing_delay
                 self.camera.processing_delay = 0
                 
                 self.camera.start_calibration()
-                self.calibration_status.setText("Status: Calibrating...")
-                
-                # Check calibration status periodically
-                self.calibration_timer = QTimer()
-                self.calibration_timer.timeout.connect(self.check_calibration_status)
-                self.calibration_timer.start(1000)  # Check every second
+                self._set_status("Status: Calibrating...")
 
-            except Exception as e:
-                print(f"Error starting calibration: {e}")
-                self.calibration_status.setText("Status: Calibration failed")
+            except Exception:
+                log.exception("Error starting calibration")
+                self._set_status("Status: Calibration failed")
                 # Restore processing delay if there's an error
-                if hasattr(self.camera, 'stored_processing_delay'):
+                if self.camera.stored_processing_delay is not None:
                     self.camera.processing_delay = self.camera.stored_processing_delay
         else:
-            print("Camera not initialized. Start the application first.")
-            self.calibration_status.setText("Status: Camera not initialized")
+            log.warning("Camera not initialized. Start the application first.")
+            self._set_status("Status: Camera not initialized")
             
+    def _close_panel_after_calibration(self):
+        """Collapse the panel opened for calibration, unless the user already closed it"""
+        self._panel_close_pending = False
+        self._set_panel(False)
+    
+    def _set_status(self, text):
+        """Set the calibration status label, skipping the relayout if the text is unchanged"""
+        if text != self._last_calib_status:
+            self.calibration_status.setText(text)
+            self._last_calib_status = text
+    
+    def _refresh_calibration_label(self):
+        """Show whether the slouch detector is calibrated, without touching any calibration state"""
+        if self.camera.slouch_detector.calibrated:
+            self._set_status("Status: Calibrated")
+        else:
+            self._set_status("Status: Not calibrated")
+    
     def check_calibration_status(self):
         """Check if calibration is complete"""
-        if hasattr(self, 'camera') and self.camera is not None:
-            # Check if the slouch detector is calibrated or if calibration just completed
+        if self.camera is not _NULL_CAMERA:
+            # Check if the slouch detector is calibrated
             is_calibrated = self.camera.slouch_detector.calibrated
-            just_completed = hasattr(self.camera, 'calibration_complete_time') and \
-                            time.time() - self.camera.calibration_complete_time < 2
                             
             if is_calibrated:
-                self.calibration_status.setText("Status: Calibrated")
+                self._set_status("Status: Calibrated")
                 
                 # Restore the original processing delay if calibration is complete
-                if hasattr(self.camera, 'stored_processing_delay'):
+                if self.camera.stored_processing_delay is not None:
                     self.camera.processing_delay = self.camera.stored_processing_delay
-                    delattr(self.camera, 'stored_processing_delay')
-                
-                # If calibration just completed, make sure we update the panel UI
-                if just_completed:
-                    self.update_calibration_status()
+                    self.camera.stored_processing_delay = None
                 
                 # Close the slide-out panel after calibration is complete
-                if self.panel_expanded and not self.temp_panel_expanded:
-                    QTimer.singleShot(1000, self.toggle_panel)
+                if self.panel_expanded and not self.temp_panel_expanded and not self._panel_close_pending:
+                    self._panel_close_pending = True
+                    QTimer.singleShot(1000, self._close_panel_after_calibration)
                 
                 # Restore enable slouch detection value
                 self.camera.enable_slouch_detection = self.temp_enable_slouch_detection
-
-                # Stop the timer if we were using one
-                if hasattr(self, 'calibration_timer') and self.calibration_timer.isActive():
-                    self.calibration_timer.stop()
             else:
-                # Update the calibration status message and progress
-                self.update_calibration_status()
-                
                 # If no longer calibrating but not calibrated, something went wrong
                 if not self.camera.is_calibrating:
-                    self.calibration_status.setText("Status: Not calibrated")
+                    self._set_status("Status: Not calibrated")
                     # Restore the processing delay if calibration failed
-                    if hasattr(self.camera, 'stored_processing_delay'):
+                    if self.camera.stored_processing_delay is not None:
                         self.camera.processing_delay = self.camera.stored_processing_delay
-                        delattr(self.camera, 'stored_processing_delay')
-                    if hasattr(self, 'calibration_timer') and self.calibration_timer.isActive():
-                        self.calibration_timer.stop()
+                        self.camera.stored_processing_delay = None
         else:
-            self.calibration_status.setText("Status: Camera not initialized")
-            # Stop timer if active
-            if hasattr(self, 'calibration_timer') and self.calibration_timer.isActive():
-                self.calibration_timer.stop()
+            self._set_status("Status: Camera not initialized")
             
     def toggle_application(self):
         """Toggle the application between running and stopped states"""
         if self.application_running:
             self.stop_application()
-            if self.panel_expanded:
-                self.toggle_panel()
+            self._set_panel(False)
         else:
             self.start_application()
             
@@ -879,23 +1035,33 @@ class HabitKickerGUI(QMainWindow):
             self.application_running = True
             
             # Initialize camera with current settings
-            if not hasattr(self, 'camera') or self.camera is None:
-                nail_distance = self.settings["nail_distance"]
-                hair_distance = self.settings["hair_distance"]
-                
-                self.camera = Camera(
-                    max_nail_pulling_distance = nail_distance,
-                    max_hair_pulling_distance = hair_distance,
-                    slouch_threshold = 15,
-                    gui_window = self
+            if self.camera is _NULL_CAMERA:
+                settings = self.settings
+                nail_distance, hair_distance = settings.nail_distance, settings.hair_distance
+                show_notifications, show_outline, show_tint = (
+                    settings.show_notifications, settings.show_screen_outline, settings.show_red_tint
                 )
                 
-                # Set camera processing delay
-                self.camera.processing_delay = 1.0 / self.settings["camera_fps"] # Convert FPS to seconds
+                # Loading the models and overlay windows is slow, so the camera is only created once
+                if self._camera is None:
+                    from camera import Camera  # Imported here since it pulls in MediaPipe and OpenCV
+                    
+                    self._camera = Camera(
+                        max_nail_pulling_distance = nail_distance,
+                        max_hair_pulling_distance = hair_distance,
+                        slouch_threshold = 15,
+                        gui_window = self
+                    )
+                    
+                    # Receive new frames from the camera thread
+                    self._camera.frame_ready.connect(self.update_camera_feed, Qt.ConnectionType.QueuedConnection)
+                    # Calibration progress and completion are pushed by the camera thread instead of polled
+                    self._camera.calibration_progress.connect(self.update_calibration_status, Qt.ConnectionType.QueuedConnection)
+                    self._camera.calibration_done.connect(self._on_calibration_done, Qt.ConnectionType.QueuedConnection)
+                self.camera = self._camera
                 
-                # Set alarm volume
-                volume = self.settings["alarm_volume"] / 100.0  # Convert percentage to 0-1 range
-                self.camera.screen_overlay.alarm_volume = volume
+                self._last_drawn_id = -1
+                self.camera.display_size = (self.camera_view.width(), self.camera_view.height())
                 
                 # Wait until tkinter windows are initialized
                 while not self.camera.screen_overlay.root or not self.camera.screen_overlay.windows:
@@ -905,14 +1071,9 @@ class HabitKickerGUI(QMainWindow):
                 self.notification_checkbox.setEnabled(True)
                 self.outline_checkbox.setEnabled(True)
                 self.tint_checkbox.setEnabled(True)
-                if self.settings["show_red_tint"]:
-                    self.volume_slider.setEnabled(True)
-                    self.volume_value_label.setEnabled(True)
-                    self.volume_label.setEnabled(True)
-                else:
-                    self.volume_slider.setEnabled(False)
-                    self.volume_value_label.setEnabled(False)
-                    self.volume_label.setEnabled(False)
+                self.volume_slider.setEnabled(show_tint)
+                self.volume_value_label.setEnabled(show_tint)
+                self.volume_label.setEnabled(show_tint)
 
                 self.nail_toggle.setEnabled(True)
                 self.hair_toggle.setEnabled(True)
@@ -925,44 +1086,37 @@ class HabitKickerGUI(QMainWindow):
                 self.restore_button.setEnabled(True)
 
                 # Restore settings
-                self.toggle_notifications(self.settings["show_notifications"] * 2)
-                self.toggle_screen_outline(self.settings["show_screen_outline"] * 2)
-                self.toggle_tint(self.settings["show_red_tint"] * 2)
+                self.toggle_notifications(show_notifications * 2)
+                self.toggle_screen_outline(show_outline * 2)
+                self.toggle_tint(show_tint * 2)
 
-                # Start camera processing
+                # Start (or resume) camera processing
                 self.camera.start_camera_no_window()
                 
                 # Wait until camera is fully initialized
                 while not self.camera.cap:
                     time.sleep(0.1)
                 # Additional delay to ensure full initialization of alert windows
-                time.sleep(-self.settings["camera_fps"]/30 + 1)
+                time.sleep(-settings.camera_fps/30 + 1)
 
-                # Configure detection settings
-                self.camera.enable_nail_detection = self.settings["nail_detection"]
-                self.camera.enable_hair_detection = self.settings["hair_detection"]
-                self.camera.enable_slouch_detection = self.settings["slouch_detection"]
+                # Configure detection thresholds, toggles, alerts, volume and FPS in one batch
+                self.camera.configure(**asdict(settings))
 
-                self.camera.screen_overlay.notification_visible = self.settings["show_notifications"]
-                self.camera.screen_overlay.show_outline_enabled = self.settings["show_screen_outline"]
-                self.camera.screen_overlay.show_red_tint = self.settings["show_red_tint"]
-
-                # Check calibration status
-                self.temp_enable_slouch_detection = self.camera.enable_slouch_detection
-                self.check_calibration_status()
+                # Show whether a saved calibration was loaded
+                self._refresh_calibration_label()
 
                 # Open panel on startup
-                self.toggle_panel()
+                self._set_panel(True)
 
                 # Automatically select window
                 self.focus_window()
 
-                print("HabitKicker initialized successfully")
+                log.info("HabitKicker initialized successfully")
             else:
-                print("HabitKicker is already running")
+                log.info("HabitKicker is already running")
                 
-        except Exception as e:
-            print(f"Error starting HabitKicker: {e}")
+        except Exception:
+            log.exception("Error starting HabitKicker")
             self.start_button.setText("Start HabitKicker")
             self.application_running = False
             
@@ -971,22 +1125,20 @@ class HabitKickerGUI(QMainWindow):
         try:
             # Update UI
             self.start_button.setText("Start HabitKicker")
-            self.calibration_status.setText("Status: Camera not initialized")
+            self._set_status("Status: Camera not initialized")
             self.application_running = False
 
-            # Disable alerts
-            if hasattr(self, 'camera') and self.camera is not None:
-                if hasattr(self.camera.screen_overlay, 'notification_visible'):
-                    self.camera.screen_overlay.show_notification = False
-                    if self.camera.screen_overlay.notification_window and self.camera.screen_overlay.notification_window.winfo_exists():
-                        self.camera.screen_overlay.notification_window.withdraw()
+            # Disable alerts (the overlay windows are only touched on its Tk thread)
+            overlay = self.camera.screen_overlay
+            overlay.show_notification = False
+            overlay.call_on_tk_thread(overlay.hide_notification)
 
-                self.camera.screen_overlay.show_outline_enabled = False
-                self.camera.screen_overlay.set_outline_transparency(0)
+            overlay.show_outline_enabled = False
+            overlay.call_on_tk_thread(overlay.set_outline_transparency, 0)
 
-                self.camera.screen_overlay.show_red_tint = False
-                if self.camera.screen_overlay.is_tinted:
-                    self.camera.screen_overlay.hide_tint()
+            overlay.show_red_tint = False
+            if overlay.is_tinted:
+                overlay.call_on_tk_thread(overlay.hide_tint)
 
             # Disable all settings
             self.notification_checkbox.setEnabled(False)
@@ -1006,15 +1158,15 @@ class HabitKickerGUI(QMainWindow):
             self.calibrate_button.setEnabled(False)
             self.restore_button.setEnabled(False)
 
-            # Stop camera and cleanup
-            if hasattr(self, 'camera') and self.camera is not None:
-                self.camera.stop_camera()
-                self.camera = None
+            # Pause the camera; it is only shut down when the application quits
+            if self.camera is not _NULL_CAMERA:
+                self.camera.pause_camera()
+                self.camera = _NULL_CAMERA
                 
-            print("HabitKicker stopped successfully")
+            log.info("HabitKicker stopped successfully")
             
-        except Exception as e:
-            print(f"Error stopping HabitKicker: {e}")
+        except Exception:
+            log.exception("Error stopping HabitKicker")
             
     def closeEvent(self, event):
         """Override close event to minimize to tray instead of closing"""
@@ -1025,44 +1177,41 @@ class HabitKickerGUI(QMainWindow):
             self.quit_application()
             event.accept()
 
-    def resizeWindow(self, event):
+    def resizeEvent(self, event):
         """Handle window resize events"""
         super().resizeEvent(event)
-        # Update camera feed when window is resized
-        self.update_camera_feed()
+        # Update camera feed 50 ms after the last resize event
+        self._resize_debounce.start(50)
 
     def toggle_nail_detection(self, state):
         """Toggle nail detection on/off"""
         enabled = state == Qt.CheckState.Checked.value
         # Update settings
-        self.settings["nail_detection"] = enabled
-        self.save_settings()
+        self.settings.nail_detection = enabled
+        self._save_timer.start()
         # Update camera if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.enable_nail_detection = enabled
-        print(f"Nail detection {'enabled' if enabled else 'disabled'}")
+        self.camera.enable_nail_detection = enabled
+        log.info("Nail detection %s", "enabled" if enabled else "disabled")
         
     def toggle_hair_detection(self, state):
         """Toggle hair detection on/off"""
         enabled = state == Qt.CheckState.Checked.value
         # Update settings
-        self.settings["hair_detection"] = enabled
-        self.save_settings()
+        self.settings.hair_detection = enabled
+        self._save_timer.start()
         # Update camera if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.enable_hair_detection = enabled
-        print(f"Hair detection {'enabled' if enabled else 'disabled'}")
+        self.camera.enable_hair_detection = enabled
+        log.info("Hair detection %s", "enabled" if enabled else "disabled")
         
     def toggle_slouch_detection(self, state):
         """Toggle slouch detection on/off"""
         enabled = state == Qt.CheckState.Checked.value
         # Update settings
-        self.settings["slouch_detection"] = enabled
-        self.save_settings()
+        self.settings.slouch_detection = enabled
+        self._save_timer.start()
         # Update camera if running
-        if hasattr(self, 'camera') and self.camera is not None:
-            self.camera.enable_slouch_detection = enabled
-        print(f"Slouch detection {'enabled' if enabled else 'disabled'}")
+        self.camera.enable_slouch_detection = enabled
+        log.info("Slouch detection %s", "enabled" if enabled else "disabled")
 
     def keyPressEvent(self, event):
         """Handle key press events"""
@@ -1079,8 +1228,13 @@ class HabitKickerGUI(QMainWindow):
 
     def quit_application(self):
         """Quit the application"""
+        # Write any settings change still waiting on the save timer
+        if self._save_timer.isActive():
+            self._flush_settings()
         if self.application_running:
             self.stop_application()
+        if self._camera is not None:
+            self._camera.stop_camera()
         QApplication.quit()
 
     def tray_icon_clicked(self, reason):
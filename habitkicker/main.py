@@ -1,11 +1,15 @@
 """Main entry point for the HabitKicker application"""
 
 import sys
+import logging
 from PyQt6.QtWidgets import QApplication
 from gui.gui import HabitKickerGUI
 
 def main():
     """Main function to run the HabitKicker application"""
+    # Show the GUI's status messages on the console like the other modules' prints
+    logging.basicConfig(level = logging.INFO, format = "%(message)s")
+    
     app = QApplication(sys.argv)
     
     # Create and show the GUI
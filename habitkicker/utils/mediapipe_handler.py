@@ -15,15 +15,21 @@ class MediapipeHandler:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
+        # Video mode (static_image_mode = False) tracks landmarks between frames instead of re-detecting every frame
         self.hands = self.mp_hands.Hands(
+            static_image_mode = False,
             min_detection_confidence = self.CONFIDENCE,
             min_tracking_confidence = self.CONFIDENCE
         )
         self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode = False,
+            max_num_faces = 1,  # Only the first face is used
+            refine_landmarks = False,  # Iris refinement isn't needed for the mouth and forehead points
             min_detection_confidence = self.CONFIDENCE,
             min_tracking_confidence = self.CONFIDENCE
         )
         self.pose = self.mp_pose.Pose(
+            static_image_mode = False,
             min_detection_confidence = self.CONFIDENCE,
             min_tracking_confidence = self.CONFIDENCE,
             model_complexity = 1  # Use medium complexity for better accuracy
@@ -2,39 +2,58 @@
 
 import time
 import threading
+from functools import partial
 import tkinter as tk
-from tkinter import Toplevel, Canvas
-from win32gui import SetWindowLong, GetWindowLong, SetLayeredWindowAttributes
-from win32con import WS_EX_LAYERED, WS_EX_TRANSPARENT, GWL_EXSTYLE, LWA_ALPHA
+from tkinter import Toplevel, Canvas, font as tkfont
+from win32gui import SetWindowLong, SetLayeredWindowAttributes, SetWindowPos
+from win32con import (
+    WS_EX_LAYERED, WS_EX_TRANSPARENT, GWL_EXSTYLE, LWA_ALPHA, SWP_NOSIZE, SWP_NOZORDER, SWP_NOACTIVATE
+)
 import pygame.mixer
 import os
 
+# Notification background color for each outline color
+_NOTIFICATION_BG_COLORS = {
+    "orange": "#663300",  # Orange
+    "red": "#660000",  # Red
+    "green2": "#006600"  # Green
+}
+
 class ScreenOverlay:
     def __init__(self):
         """Initialize the screen outline overlay"""
         self.thickness = 20
         self.current_alpha = 0  # Tracks current transparency
+        self._applied_alpha = 0  # Transparency last applied to the outline windows (they are created transparent)
         self.root = None
         self.windows = []
+        self.outline_window = None  # Fullscreen window drawing the four outline segments
         self.current_color = None
         self.is_showing = False
-        self.shutdown_requested = False
-        self.habit_status = {
-            'nail_biting': {'active': False, 'start_time': 0},
-            'hair_pulling': {'active': False, 'start_time': 0},
-            'slouching': {'active': False, 'start_time': 0}
-        }
+        self.shutdown_event = threading.Event()  # Set once shutdown() has been requested
         self.nail_detection_threshold = 1.5  # seconds
         self.hair_detection_threshold = 0.5  # seconds
         self.slouch_detection_threshold = 3.0  # seconds
+        # Per-habit alert messages and thresholds, in the order update_habit_status receives the habits
+        habit_messages = ("Nail Biting Detected!", "Hair Pulling Detected!", "Slouching Detected!")
+        self._habit_thresholds = (self.nail_detection_threshold, self.hair_detection_threshold, self.slouch_detection_threshold)
+        self._habit_start_times = [0.0] * len(habit_messages)  # When each habit was first detected
+        self._active_mask = 0  # Bit i is set while habit i is detected
+        # Joined message for every combination of habits, indexed by a bit mask (bit i is habit i)
+        self._message_table = tuple(
+            "\n".join(message for i, message in enumerate(habit_messages) if mask & (1 << i))
+            for mask in range(1 << len(habit_messages))
+        )
         self.clear_threshold = 2.0  # seconds
         self.last_detection_time = 0
+        self._pending_update = None  # Latest (nail_biting, hair_pulling, slouching, time) waiting for the Tk thread
+        self._update_scheduled = False  # Whether _apply_pending_update is already queued on the Tk loop
         self.message_text = ""
         
         # Alert escalation tracking
-        self.orange_outline_start_time = 0  # When orange outline first appeared
-        self.red_outline_start_time = 0  # When red outline first appeared
         self.escalation_threshold = 1.1  # Time before escalating to next alert level
+        self._outline_escalation_id = None  # Pending after() call that escalates the current outline color
+        self._outline_escalated = False  # Whether the current outline color has shown long enough to escalate
         self.tint_window = None
         self.is_tinted = False
         
@@ -57,12 +76,27 @@ class ScreenOverlay:
         self.notification_current_x = self.notification_start_x
         self.notification_animation_steps = 15  # Number of steps for animation
         self.notification_animation_delay = 20  # Milliseconds between animation steps
+        self._last_notification_text = ""  # Text currently set on the notification canvas
+        self._notification_hwnd = None  # Native handle of the notification window, looked up once it is mapped
+        self._notification_size = (0, 0)  # Width and height of the notification window
+        self._notification_bg_images = {}  # Pre-rendered notification backgrounds, keyed by fill color
+        
+        # The animation paths never change, so compute them once along with the step callbacks
+        self._slide_in_positions, self._slide_out_positions = self._compute_slide_positions()
+        self._notification_animation_index = 0  # Next position of the running animation
+        self._animate_in_callback = partial(self._animate_notification_step, True)
+        self._animate_out_callback = partial(self._animate_notification_step, False)
         
         # Audio alert tracking
         self.audio_playing = False
         self.audio_initialized = False
         self.alarm_sound = None
-        self.tint_start_time = 0  # When the red tint was first shown
+        self._alarm_channel = None  # Mixer channel reserved for the alarm
+        self.sound_path = None  # Path of the alarm sound, if it exists
+        self._audio_thread = None  # Starts the mixer and loads the alarm sound off the Tk thread
+        self._tint_escalation_id = None  # Pending after() call that fires once the tint has shown for escalation_threshold seconds
+        self._tint_escalated = False  # Whether the tint has shown long enough for the alarm
+        self._habit_alerting = False  # Whether the latest status update had a habit past its detection threshold
         self.alarm_volume = 0.1  # Default volume for the alarm sound
         
         # Initialize tkinter in a separate thread
@@ -75,6 +109,11 @@ class ScreenOverlay:
         self.root = tk.Tk()
         self.root.withdraw()  # Hide the main window
         
+        # Named fonts are created once and shared, so Tk doesn't parse a font spec for each text item
+        self._overlay_font = tkfont.Font(root = self.root, family = "Calibri", size = 18)
+        self._title_font = tkfont.Font(root = self.root, family = "Calibri", size = 15, weight = "bold")
+        self._notification_font = tkfont.Font(root = self.root, family = "Calibri", size = 14)
+        
         # Get screen dimensions
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
@@ -82,22 +121,23 @@ class ScreenOverlay:
         # Create outline windows (top, right, bottom, left)
         self._create_outline_windows(screen_width, screen_height)
         
-        # Initialize audio
+        # Locate the alarm sound; the mixer itself is only started the first time the alarm plays
         base_dir = os.getcwd()
         sound_path = os.path.join(base_dir, "sounds", "beep.wav")
         if os.path.exists(sound_path):
-            self.initialize_audio(sound_path)
+            self.sound_path = sound_path
         else:
             print(f"Warning: Sound file not found at {sound_path}")
         
-        # Check for shutdown periodically
-        self.root.after(100, self._check_shutdown)
+        # Handle a shutdown requested before the Tk loop existed (later requests schedule it themselves)
+        if self.shutdown_event.is_set():
+            self.root.after_idle(self._destroy_root)
         
         # Start the tkinter main loop
         self.root.mainloop()
     
     def _create_outline_windows(self, width, height):
-        """Create the four windows that form the screen outline
+        """Create the windows that form the screen outline, message and notification (the tint is created when first shown)
         
         Args:
             width: Screen width
@@ -107,23 +147,11 @@ class ScreenOverlay:
         for window in self.windows:
             window.destroy()
         self.windows = []
+        self._applied_alpha = 0  # The new outline window starts fully transparent
         
-        # Create the four outline segments
-        # Top
-        top = self._create_outline_segment(0, 0, width, self.thickness)
-        self.windows.append(top)
-        
-        # Right
-        right = self._create_outline_segment(width - self.thickness, 0, self.thickness, height)
-        self.windows.append(right)
-        
-        # Bottom
-        bottom = self._create_outline_segment(0, height - self.thickness, width, self.thickness)
-        self.windows.append(bottom)
-        
-        # Left
-        left = self._create_outline_segment(0, 0, self.thickness, height)
-        self.windows.append(left)
+        # Create the outline (all four segments live in one fullscreen window)
+        self.outline_window = self._create_outline_window(width, height)
+        self.windows.append(self.outline_window)
         
         # Create message window in top-left corner
         msg_window = self._create_message_window(self.notification_target_pos, self.notification_target_pos, 400, 100)
@@ -132,31 +160,36 @@ class ScreenOverlay:
         # Create notification window in top-left corner
         self._create_notification_window(self.notification_target_pos + 1, self.notification_target_pos + 1, 358, 168)
         
-        # Create tint window (initially hidden)
-        self._create_tint_window(width, height)
-        
-        # Hide all windows initially
-        self.hide_notification_and_outline()
+        # Hide the outline initially (hide_notification_and_outline skips it while is_showing is False)
+        self._ensure_hidden(self.outline_window)
     
-    def _create_outline_segment(self, x, y, width, height):
-        """Create a single outline segment window
+    def _create_outline_window(self, width, height):
+        """Create a fullscreen transparent window with the four outline segments drawn as rectangles
         
         Args:
-            x, y: Position coordinates
-            width, height: Dimensions of the segment
+            width: Screen width
+            height: Screen height
         
         Returns:
             Toplevel window object
         """
         window = Toplevel(self.root)
-        window.geometry(f"{width}x{height}+{x}+{y}")
+        window.is_mapped = True  # Toplevels are mapped when created; kept in sync by _ensure_shown/_ensure_hidden
+        window.geometry(f"{width}x{height}+0+0")
         window.overrideredirect(True)  # Remove window decorations
         window.attributes("-topmost", True)  # Keep on top
         window.attributes("-alpha", 0)  # Set transparency
         
-        # Create canvas for drawing
-        canvas = Canvas(window, bg = "black", highlightthickness = 0, width = width, height = height)
+        # Create canvas for drawing; its white background is keyed out below so only the segments show
+        canvas = Canvas(window, bg = "white", highlightthickness = 0, width = width, height = height)
         canvas.pack(fill = tk.BOTH, expand = True)
+        window.canvas = canvas  # Kept on the window so updates don't have to look it up through Tk
+        
+        # Create the four outline segments (top, right, bottom, left), all recolored through the "outline" tag
+        t = self.thickness
+        for x0, y0, x1, y1 in ((0, 0, width, t), (width - t, 0, width, height),
+                               (0, height - t, width, height), (0, 0, t, height)):
+            canvas.create_rectangle(x0, y0, x1, y1, fill = "black", width = 0, tags = "outline")
 
         # Make window click-through
         window.attributes("-transparentcolor", "white")
@@ -176,6 +209,7 @@ class ScreenOverlay:
             Toplevel window object
         """
         window = Toplevel(self.root)
+        window.is_mapped = True  # Toplevels are mapped when created; kept in sync by _ensure_shown/_ensure_hidden
         window.geometry(f"{width}x{height}+{x}+{y}")
         window.overrideredirect(True)  # Remove window decorations
         window.attributes("-topmost", True)  # Keep on top
@@ -187,9 +221,10 @@ class ScreenOverlay:
         # Create canvas for drawing text
         canvas = Canvas(window, bg = "black", highlightthickness = 0, width = width, height = height)
         canvas.pack(fill = tk.BOTH, expand = True)
+        window.canvas = canvas
 
         # Add text item
-        canvas.create_text(10, 10, anchor = "nw", text = "", fill = "red", font = ("Calibri", 18), tags = "message")
+        canvas.create_text(10, 10, anchor = "nw", text = "", fill = "red", font = self._overlay_font, tags = "message")
         
         return window
     
@@ -201,6 +236,7 @@ class ScreenOverlay:
             width, height: Dimensions of the window
         """
         window = Toplevel(self.root)
+        window.is_mapped = True  # Toplevels are mapped when created; kept in sync by _ensure_shown/_ensure_hidden
         # Start off-screen to the left
         window.geometry(f"{width}x{height}+{self.notification_start_x}+{y}")
         window.overrideredirect(True)  # Remove window decorations
@@ -210,20 +246,19 @@ class ScreenOverlay:
         # Create canvas for drawing
         canvas = Canvas(window, highlightthickness = 0, width = width, height = height)
         canvas.pack(fill = tk.BOTH, expand = True)
+        window.canvas = canvas
+        self._notification_size = (width, height)
         
-        # Create notification background
-        canvas.create_rectangle(0, 0, width, height, fill = "black", outline = "gray", width = 2, tags = "bg")
+        # Create notification background (border and horizontal line are part of the image)
+        canvas.create_image(0, 0, anchor = "nw", image = self._get_notification_bg_image("black"), tags = "bg")
         
         # Add title
         canvas.create_text(10, 10, anchor = "nw", text = "HabitKicker Alert", fill = "white", 
-                          font = ("Calibri", 15, "bold"), tags = "title")
-        
-        # Add horizontal line
-        canvas.create_line(10, 50, width - 10, 50, fill = "gray", tags = "line")
+                          font = self._title_font, tags = "title")
         
         # Add message text
         canvas.create_text(10, 56, anchor = "nw", text = "", fill = "white", 
-                          font = ("Calibri", 14), width = width - 20, tags = "notification_text")
+                          font = self._notification_font, width = width - 20, tags = "notification_text")
         
         # Make window click-through
         window.attributes("-transparentcolor", "white")
@@ -231,7 +266,7 @@ class ScreenOverlay:
         self._set_click_through(canvas.winfo_id())
 
         # Hide the window initially
-        window.withdraw()
+        self._ensure_hidden(window)
         
         self.notification_window = window
         return window
@@ -244,14 +279,16 @@ class ScreenOverlay:
             height: Screen height
         """
         window = Toplevel(self.root)
+        window.is_mapped = True  # Toplevels are mapped when created; kept in sync by _ensure_shown/_ensure_hidden
         window.geometry(f"{width}x{height}+0+0")
         window.overrideredirect(True)  # Remove window decorations
         window.attributes("-topmost", True)  # Keep on top
         window.attributes("-alpha", 0.25)  # Set transparency to 25%
         
-        # Create canvas for drawing
-        canvas = Canvas(window, bg = "black", highlightthickness = 0, width = width, height = height)
+        # Create canvas for drawing, already in the tint color
+        canvas = Canvas(window, bg = "red", highlightthickness = 0, width = width, height = height)
         canvas.pack(fill = tk.BOTH, expand = True)
+        window.canvas = canvas
         
         # Make window click-through
         window.attributes("-transparentcolor", "white")
@@ -259,15 +296,27 @@ class ScreenOverlay:
         self._set_click_through(canvas.winfo_id())
 
         # Hide the window initially
-        window.withdraw()
+        self._ensure_hidden(window)
         
         self.tint_window = window
     
+    def _ensure_shown(self, window):
+        """Show a window, skipping the deiconify (and the window manager work it triggers) if it's already shown"""
+        if not window.is_mapped:
+            window.deiconify()
+            window.is_mapped = True
+    
+    def _ensure_hidden(self, window):
+        """Hide a window, skipping the withdraw if it's already hidden"""
+        if window.is_mapped:
+            window.withdraw()
+            window.is_mapped = False
+    
     def _set_click_through(self, hwnd):
+        """Make a window ignore mouse input so clicks pass through to the windows below"""
         try:
-            styles = GetWindowLong(hwnd, GWL_EXSTYLE)
-            styles = WS_EX_LAYERED | WS_EX_TRANSPARENT
-            SetWindowLong(hwnd, GWL_EXSTYLE, styles)
+            # The extended style is replaced outright, so there's no need to read the current one first
+            SetWindowLong(hwnd, GWL_EXSTYLE, WS_EX_LAYERED | WS_EX_TRANSPARENT)
             SetLayeredWindowAttributes(hwnd, 0, 255, LWA_ALPHA)
         except Exception as e:
             print(e)
@@ -283,14 +332,24 @@ class ScreenOverlay:
             
         self.current_alpha = alpha
         
-        # Update transparency for outline windows only (excluding notification window)
-        for window in self.windows[:-1]:  # Skip message window
-            window.attributes("-alpha", alpha)
+        # Update transparency for the outline window only (excluding notification window)
+        self._apply_outline_alpha(alpha)
             
         # Make sure windows are visible even if transparent
         if not self.is_showing:
             self.is_showing = True
 
+    def _apply_outline_alpha(self, alpha):
+        """Set the transparency of the outline window, skipping it if already applied
+        
+        Args:
+            alpha: Transparency value (0-1)
+        """
+        if alpha == self._applied_alpha:
+            return
+        self.outline_window.attributes("-alpha", alpha)
+        self._applied_alpha = alpha
+
     def show_outline(self, color):
         """Show the outline in the specified color
         
@@ -299,49 +358,75 @@ class ScreenOverlay:
         """
         if not self.root or not self.windows:
             return
-            
-        current_time = time.time()
         
-        # Update escalation tracking based on color
-        if color == "orange":
-            if self.current_color != "orange":
-                self.orange_outline_start_time = current_time
-        elif color == "red":
-            if self.current_color != "red":
-                self.red_outline_start_time = current_time
+        # Nothing to do if the outline is already showing in this color
+        if color == self.current_color and self.is_showing and self.outline_window.is_mapped:
+            return
+        
+        color_changed = color != self.current_color
+        
+        # Time the escalation of an alert color once, when it first appears
+        if color_changed or not self.outline_window.is_mapped:
+            self._cancel_outline_escalation()
+            if color in ("orange", "red"):
+                self._outline_escalation_id = self.root.after(int(self.escalation_threshold * 1000),
+                                                              self._on_outline_escalation)
         
         self.current_color = color
         
-        # Update all outline windows
-        for window in self.windows[:-1]:  # Skip message window
-            canvas = window.winfo_children()[0]
-            canvas.configure(bg = color)
-            # Ensure proper transparency is maintained
-            window.attributes("-alpha", self.current_alpha)
+        # Recolor the outline segments only when the color actually changes
+        if color_changed:
+            self.outline_window.canvas.itemconfig("outline", fill = color)
+        # Ensure proper transparency is maintained
+        self._apply_outline_alpha(self.current_alpha)
         
-        # Show all windows
+        # Show all windows that aren't already shown
         for window in self.windows:
-            window.deiconify()
+            self._ensure_shown(window)
             
         # Update notification color to match outline
-        self._update_notification_color(color)
+        if color_changed:
+            self._update_notification_color(color)
         
         self.is_showing = True
     
+    def _cancel_outline_escalation(self):
+        """Cancel the pending escalation of the outline color, if any"""
+        if self._outline_escalation_id is not None:
+            self.root.after_cancel(self._outline_escalation_id)
+            self._outline_escalation_id = None
+        self._outline_escalated = False
+    
+    def _on_outline_escalation(self):
+        """Escalate the alert once the outline color has shown for the escalation threshold"""
+        self._outline_escalation_id = None
+        self._outline_escalated = True
+        # Escalate right away if a habit is still being alerted on; otherwise the next alerting update does it
+        if self._habit_alerting and self.is_showing:
+            self._escalate_outline()
+    
+    def _escalate_outline(self):
+        """Move an escalated alert to the next level: orange outline to red, red outline to the tint"""
+        if self.current_color == "orange":
+            self.show_outline("red")
+        elif self.current_color == "red" and not self.is_tinted:
+            self.show_tint()
+    
     def hide_notification_and_outline(self):
         """Hide the notification and outline"""
         if not self.root or not self.windows:
             return
+        
+        self._cancel_outline_escalation()
             
-        # Hide all outline windows
-        for window in self.windows[:-1]:  # Skip message window
-            window.withdraw()
+        # Hide the outline window, unless it's already hidden
+        if self.is_showing:
+            self._ensure_hidden(self.outline_window)
+            self.is_showing = False
         
         # Hide notification window with animation if it's visible
         if self.notification_window and self.notification_visible:
             self._hide_notification_with_animation()
-
-        self.is_showing = False
     
     def update_message(self, message):
         """Update the detection message
@@ -349,19 +434,27 @@ class ScreenOverlay:
         Args:
             message: Text message to display
         """
-        if not self.root or len(self.windows) < 5:
+        if not self.root or not self.windows:
             return
-            
-        # Get message window and its canvas
-        msg_window = self.windows[-1]
-        canvas = msg_window.winfo_children()[0]
         
-        # Always set empty string to hide messages in screen overlay
-        canvas.itemconfig("message", text = "")
+        # The message window's text is created empty and always stays that way to hide messages in the screen overlay
         
         # Update notification text - still show messages in notification
         self._update_notification_text(message)
     
+    def _set_message(self, message):
+        """Set the detection message, skipping the update when it would change neither the text
+        nor whether the notification is shown
+        
+        Args:
+            message: Text message to display
+        """
+        wants_notification = bool(message) and self.is_showing and self.current_color != "green2" and self.show_notification
+        if message == self.message_text and self.notification_visible == wants_notification:
+            return
+        self.message_text = message
+        self.update_message(message)
+    
     def _update_notification_text(self, message):
         """Update the notification window text
         
@@ -371,10 +464,10 @@ class ScreenOverlay:
         if not self.root or not self.notification_window:
             return
             
-        canvas = self.notification_window.winfo_children()[0]
-        
-        # Update text
-        canvas.itemconfig("notification_text", text = message)
+        # Update text only when it changed, since itemconfig redraws the canvas
+        if message != self._last_notification_text:
+            self.notification_window.canvas.itemconfig("notification_text", text = message)
+            self._last_notification_text = message
         
         # Show or hide notification based on message content and current color
         # Don't show notification for green outline
@@ -385,16 +478,24 @@ class ScreenOverlay:
             # Hide with animation
             self._hide_notification_with_animation()
     
+    def hide_notification(self):
+        """Hide the notification window immediately, without the slide-out animation"""
+        if not self.root or not self.notification_window:
+            return
+        self._ensure_hidden(self.notification_window)
+        self.notification_visible = False
+    
     def _show_notification_with_animation(self):
         """Show the notification window with a slide-in animation from the left"""
         if not self.root or not self.notification_window or self.notification_animation_in_progress or not self.show_notification:
             return
             
         # Make window visible but at the starting position
-        self.notification_window.deiconify()
+        self._ensure_shown(self.notification_window)
         self.notification_visible = True
         self.notification_animation_in_progress = True
         self.notification_current_x = self.notification_start_x
+        self._notification_animation_index = 0
         
         # Start the animation
         self._animate_notification_step(animation_showing=True)
@@ -406,57 +507,71 @@ class ScreenOverlay:
             
         # Start the animation from current position
         self.notification_animation_in_progress = True
+        self._notification_animation_index = 0
         
         # Start the animation
         self._animate_notification_step(animation_showing=False)
     
+    def _compute_slide_positions(self):
+        """Precompute the x positions of the notification slide-in and slide-out animations
+        
+        Returns:
+            Tuple of (slide-in positions, slide-out positions); slide-out starts from the target position
+        """
+        # Slide-in: move faster at the beginning, slower at the end, finishing exactly on the target
+        slide_in = []
+        x = self.notification_start_x
+        while x < self.notification_target_pos:
+            x = min(x + max(1, (self.notification_target_pos - x) // 5), self.notification_target_pos)
+            slide_in.append(x)
+        
+        # Slide-out: move faster as it gets further away; the window is hidden once it would pass the start
+        slide_out = []
+        x = self.notification_target_pos - max(5, abs(self.notification_target_pos) // 3)
+        while x > self.notification_start_x:
+            slide_out.append(x)
+            x -= max(5, abs(x) // 3)
+        
+        return slide_in, slide_out
+    
     def _animate_notification_step(self, animation_showing=True):
         """Perform one step of the notification animation
         
         Args:
-            is_showing: True for slide-in animation, False for slide-out animation
+            animation_showing: True for slide-in animation, False for slide-out animation
         """
         if not self.root or not self.notification_window:
             self.notification_animation_in_progress = False
             return
-            
-        if animation_showing:
-            # Slide-in animation (from left to target position)
-            # Calculate the distance to move in this step
-            distance_to_target = self.notification_target_pos - self.notification_current_x
-            step_size = max(1, distance_to_target // 5)  # Move faster at the beginning, slower at the end
-            
-            # Update position
-            self.notification_current_x += step_size
-            
-            # If we've reached or passed the target, set to target position
-            if self.notification_current_x >= self.notification_target_pos:
-                self.notification_current_x = self.notification_target_pos
-                self.notification_animation_in_progress = False
-        else:
-            # Slide-out animation (from current position to off-screen left)
-            # Calculate step size based on current position
-            step_size = max(5, abs(self.notification_current_x) // 3)  # Move faster as it gets further away
-            
-            # Update position
-            self.notification_current_x -= step_size
-            
-            # If we've moved off-screen, finish the animation
-            if self.notification_current_x <= self.notification_start_x:
-                self.notification_current_x = self.notification_start_x
-                self.notification_animation_in_progress = False
-                # Actually hide the window when animation is complete
-                if not animation_showing and self.notification_window:
-                    self.notification_window.withdraw()
-                    self.notification_visible = False
-                return
-        
-        # Update window position
-        self.notification_window.geometry(f"+{self.notification_current_x}+{self.notification_target_pos}")
-        
-        # Schedule next animation step if not done
-        if self.notification_animation_in_progress and self.root:
-            self.root.after(self.notification_animation_delay, lambda: self._animate_notification_step(animation_showing))
+        
+        positions = self._slide_in_positions if animation_showing else self._slide_out_positions
+        step = self._notification_animation_index
+        
+        if step >= len(positions):
+            # Slide-out has moved off-screen, finish the animation and actually hide the window
+            self.notification_current_x = self.notification_start_x
+            self.notification_animation_in_progress = False
+            self._ensure_hidden(self.notification_window)
+            self.notification_visible = False
+            return
+        
+        self.notification_current_x = positions[step]
+        self._notification_animation_index = step + 1
+        
+        # Update window position directly through Win32, skipping Tk's geometry handling on every step
+        if self._notification_hwnd is None:
+            self._notification_hwnd = int(self.notification_window.wm_frame(), 16)
+        SetWindowPos(self._notification_hwnd, 0, self.notification_current_x, self.notification_target_pos, 0, 0,
+                     SWP_NOSIZE | SWP_NOZORDER | SWP_NOACTIVATE)
+        
+        # Slide-in is done once it reaches the target position
+        if animation_showing and step + 1 == len(positions):
+            self.notification_animation_in_progress = False
+            return
+        
+        # Schedule next animation step
+        self.root.after(self.notification_animation_delay,
+                        self._animate_in_callback if animation_showing else self._animate_out_callback)
     
     def _update_notification_color(self, color):
         """Update the notification window color to match the outline
@@ -467,13 +582,34 @@ class ScreenOverlay:
         if not self.root or not self.notification_window:
             return
             
-        canvas = self.notification_window.winfo_children()[0]
-        
-        # Update background color
-        canvas.itemconfig("bg", fill = self._get_notification_bg_color(color))
+        # Swap in the background for the new color; the title and line never change
+        bg_color = self._get_notification_bg_color(color)
+        if bg_color:
+            self.notification_window.canvas.itemconfig("bg", image = self._get_notification_bg_image(bg_color))
+    
+    def _get_notification_bg_image(self, fill):
+        """Get the notification background for a fill color, rendering it the first time it is used
         
-        canvas.itemconfig("title", text = "HabitKicker Alert", fill = "white")
-        canvas.itemconfig("line", fill = "gray")
+        Args:
+            fill: Background color of the notification
+            
+        Returns:
+            PhotoImage with the background, gray border and horizontal line
+        """
+        image = self._notification_bg_images.get(fill)
+        if image is None:
+            width, height = self._notification_size
+            image = tk.PhotoImage(master = self.root, width = width, height = height)
+            image.put(fill, to = (0, 0, width, height))
+            # 2px border
+            image.put("gray", to = (0, 0, width, 2))
+            image.put("gray", to = (0, height - 2, width, height))
+            image.put("gray", to = (0, 0, 2, height))
+            image.put("gray", to = (width - 2, 0, width, height))
+            # Horizontal line under the title
+            image.put("gray", to = (10, 50, width - 10, 51))
+            self._notification_bg_images[fill] = image
+        return image
     
     def _get_notification_bg_color(self, outline_color):
         """Get the appropriate notification background color based on outline color
@@ -484,39 +620,52 @@ class ScreenOverlay:
         Returns:
             Appropriate background color for the notification
         """
-        if outline_color == "orange":
-            return "#663300"  # Orange
-        elif outline_color == "red":
-            return "#660000"  # Red
-        elif outline_color == "green2":
-            return "#006600"  # Green
-        else:
-            return None
+        return _NOTIFICATION_BG_COLORS.get(outline_color)
 
     def show_tint(self):
         """Show the red screen tint"""
-        if not self.root or not self.tint_window or not self.show_red_tint:
+        if not self.root or not self.show_red_tint or self.is_tinted:
             return
         
-        # Configure the tint window with red background
-        canvas = self.tint_window.winfo_children()[0]
-        canvas.configure(bg = "red")
+        # Most sessions never escalate to the tint, so its fullscreen window is only created the first time it's needed
+        if self.tint_window is None:
+            self._create_tint_window(self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         
         # Show the tint window
-        self.tint_window.deiconify()
+        self._ensure_shown(self.tint_window)
         self.is_tinted = True
         
-        # Record the time when the tint was shown
-        self.tint_start_time = time.time()
+        # The alarm follows the tint, so get the sound ready in the background and time the escalation
+        self._preload_audio()
+        self._cancel_tint_escalation()
+        self._tint_escalation_id = self.root.after(int(self.escalation_threshold * 1000), self._on_tint_escalation)
+
+    def _cancel_tint_escalation(self):
+        """Cancel the pending tint-to-alarm escalation, if any"""
+        if self._tint_escalation_id is not None:
+            self.root.after_cancel(self._tint_escalation_id)
+            self._tint_escalation_id = None
+        self._tint_escalated = False
+
+    def _on_tint_escalation(self):
+        """Start the alarm once the tint has shown for the escalation threshold"""
+        self._tint_escalation_id = None
+        if not self.is_tinted:
+            return
+        self._tint_escalated = True
+        # Start right away if a habit is still being alerted on; otherwise the next alerting update starts it
+        if self._habit_alerting and self.is_showing and self.current_color == "red" and self.sound_path:
+            self.start_alarm()
 
     def hide_tint(self):
         """Hide the screen tint"""
-        if not self.root or not self.tint_window:
+        if not self.root or not self.tint_window or not self.is_tinted:
             return
         
-        # Hide the tint window
-        self.tint_window.withdraw()
+        # Hide the tint window and cancel its pending escalation
+        self._ensure_hidden(self.tint_window)
         self.is_tinted = False
+        self._cancel_tint_escalation()
         
         # Stop audio if it's playing
         if self.audio_playing:
@@ -527,39 +676,57 @@ class ScreenOverlay:
         if not self.root or not sound_path:
             return
         
-        # Initialize pygame mixer
-        pygame.mixer.init()
+        # Initialize pygame mixer; a large buffer avoids underruns and the extra latency doesn't matter for a beep
+        pygame.mixer.init(frequency = 44100, size = -16, channels = 1, buffer = 4096)
+        # Only the alarm and the warm-up silence below are ever played, so mix two channels instead of the default eight
+        pygame.mixer.set_num_channels(2)
         
         # Load the sound file
-        self.alarm_sound = pygame.mixer.Sound(sound_path)
-        self.alarm_sound.set_volume(self.alarm_volume)
+        alarm_sound = pygame.mixer.Sound(sound_path)
+        alarm_sound.set_volume(self.alarm_volume)
+        
+        # Reserve a channel for the alarm so playing it never has to search for a free one
+        pygame.mixer.set_reserved(1)
+        self._alarm_channel = pygame.mixer.Channel(0)
+        
+        # Play a moment of silence so the audio device is opened now rather than on the first beep
+        silence = pygame.mixer.Sound(buffer = bytes(4096))
+        silence.set_volume(0.0)
+        silence.play()
 
-        # Mark audio as initialized
+        # Mark audio as initialized; the sound is published last since start_alarm checks it from the Tk thread
         self.audio_initialized = True
+        self.alarm_sound = alarm_sound
+
+    def _preload_audio(self):
+        """Start the mixer and load the alarm sound in a background thread, if that hasn't happened yet"""
+        if self.alarm_sound or not self.sound_path or (self._audio_thread and self._audio_thread.is_alive()):
+            return
+        self._audio_thread = threading.Thread(target = self._load_audio, daemon = True)
+        self._audio_thread.start()
+
+    def _load_audio(self):
+        """Initialize the audio playback, disabling the alarm if the mixer can't be started"""
+        try:
+            self.initialize_audio(self.sound_path)
+        except pygame.error as e:
+            print(f"Warning: Could not initialize audio: {e}")
+            self.sound_path = None  # Don't retry on every tint
 
     def start_alarm(self):
         """Check if audio should start playing based on tint duration"""
-        if not self.root or not self.alarm_sound:
+        if not self.root:
             return
         
-        # Start audio
-        if not self.audio_playing:
-            self.audio_playing = True
-            # Schedule the alarm to play repeatedly
-            self._play_alarm_loop()
-
-    def _play_alarm_loop(self):
-        """Play the alarm sound in a loop while audio is playing"""
-        if not self.root or not self.audio_playing:
+        # The mixer is started in the background once the tint shows; the alarm begins on a later update if it isn't ready yet
+        if not self.alarm_sound:
+            self._preload_audio()
             return
         
-        # Play the alarm sound
-        if self.alarm_sound:
-            self.alarm_sound.play()
-        
-        # Schedule next alarm if audio is still playing
-        if self.audio_playing:
-            self.root.after(500, self._play_alarm_loop)  # Play every second (the duration of the alarm sound is 500 ms)
+        # Start audio, letting the mixer loop the sound until stop_alarm
+        if not self.audio_playing:
+            self.audio_playing = True
+            self._alarm_channel.play(self.alarm_sound, loops = -1)
 
     def stop_alarm(self):
         """Stop the audio playback"""
@@ -568,22 +735,59 @@ class ScreenOverlay:
         
         # Stop the audio playback
         self.audio_playing = False
-        if self.alarm_sound:
-            self.alarm_sound.stop()
+        self._alarm_channel.stop()
 
     def update_habit_status(self, nail_biting, hair_pulling, slouching):
+        """Queue a habit detection status update to be applied on the tkinter thread
+        
+        Tk isn't thread-safe, so the camera thread only stores the latest status here. Bursts of
+        updates are coalesced into a single _apply_pending_update call when the Tk loop is idle.
+        
+        Args:
+            nail_biting: Whether nail biting is detected
+            hair_pulling: Whether hair pulling is detected
+            slouching: Whether slouching is detected
+        """
+        if not self.root:
+            return
+        
+        # Monotonic time so clock adjustments can't break the detection and escalation thresholds
+        self._pending_update = (nail_biting, hair_pulling, slouching, time.monotonic())
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self.root.after_idle(self._apply_pending_update)
+    
+    def call_on_tk_thread(self, func, *args):
+        """Run func(*args) on the tkinter thread (safe to call from any thread)
+        
+        Tk isn't thread-safe, so other threads must go through this instead of calling the
+        methods that touch the overlay windows directly.
+        
+        Args:
+            func: Overlay method to run
+            *args: Arguments to pass to func
+        """
+        if self.root and not self.shutdown_event.is_set():
+            self.root.after_idle(func, *args)
+    
+    def _apply_pending_update(self):
+        """Apply the latest queued habit status on the tkinter thread"""
+        self._update_scheduled = False
+        self._apply_habit_status(*self._pending_update)
+    
+    def _apply_habit_status(self, nail_biting, hair_pulling, slouching, current_time):
         """Update the habit detection status and manage outline display
         
         Args:
             nail_biting: Whether nail biting is detected
             hair_pulling: Whether hair pulling is detected
             slouching: Whether slouching is detected
+            current_time: time.monotonic() value when the status was detected
         """
-        current_time = time.time()
         any_habit_active = False
         any_habit_detected = False  # Track if any habit is currently detected (even if not for detection threshold seconds yet)
-        messages = []
-        immediate_messages = []  # For habits that should show messages immediately
+        message_mask = 0  # Bit per habit whose message should be shown (see _message_table)
+        immediate_mask = 0  # For habits that should show messages immediately
         
         # First, check if green feedback is active and should be ended
         if self.green_feedback_active:
@@ -592,62 +796,31 @@ class ScreenOverlay:
                 self.hide_notification_and_outline()
                 self.green_feedback_active = False
                 # Clear the message
-                self.message_text = ""
-                self.update_message(self.message_text)
+                self._set_message("")
                 
             # While green feedback is active, don't process other habit updates
             return
         
-        # Update nail biting status
-        if nail_biting:
-            any_habit_detected = True
-            if not self.habit_status['nail_biting']['active']:
-                self.habit_status['nail_biting']['start_time'] = current_time
-                self.habit_status['nail_biting']['active'] = True
-            
-            # Check if this habit was previously detected for nail detection threshold seconds
-            if current_time - self.habit_status['nail_biting']['start_time'] >= self.nail_detection_threshold:
-                any_habit_active = True
-                messages.append("Nail Biting Detected!")
-            # If outline is already showing, display message immediately
-            elif self.is_showing:
-                immediate_messages.append("Nail Biting Detected!")
-        else:
-            self.habit_status['nail_biting']['active'] = False
-        
-        # Update hair pulling status
-        if hair_pulling:
-            any_habit_detected = True
-            if not self.habit_status['hair_pulling']['active']:
-                self.habit_status['hair_pulling']['start_time'] = current_time
-                self.habit_status['hair_pulling']['active'] = True
-            
-            # Check if this habit was previously detected for hairdetection threshold seconds
-            if current_time - self.habit_status['hair_pulling']['start_time'] >= self.hair_detection_threshold:
-                any_habit_active = True
-                messages.append("Hair Pulling Detected!")
-            # If outline is already showing, display message immediately
-            elif self.is_showing:
-                immediate_messages.append("Hair Pulling Detected!")
-        else:
-            self.habit_status['hair_pulling']['active'] = False
-        
-        # Update slouching status
-        if slouching:
-            any_habit_detected = True
-            if not self.habit_status['slouching']['active']:
-                self.habit_status['slouching']['start_time'] = current_time
-                self.habit_status['slouching']['active'] = True
-            
-            # Check if this habit was previously detected for slouch detection threshold seconds
-            if current_time - self.habit_status['slouching']['start_time'] >= self.slouch_detection_threshold:
-                any_habit_active = True
-                messages.append("Slouching Detected!")
-            # If outline is already showing, display message immediately
-            elif self.is_showing:
-                immediate_messages.append("Slouching Detected!")
-        else:
-            self.habit_status['slouching']['active'] = False
+        # Update the status of each habit
+        for i, detected in enumerate((nail_biting, hair_pulling, slouching)):
+            bit = 1 << i
+            if detected:
+                any_habit_detected = True
+                if not self._active_mask & bit:
+                    self._habit_start_times[i] = current_time
+                    self._active_mask |= bit
+                
+                # Check if this habit was previously detected for its detection threshold seconds
+                if current_time - self._habit_start_times[i] >= self._habit_thresholds[i]:
+                    any_habit_active = True
+                    message_mask |= bit
+                # If outline is already showing, display message immediately
+                elif self.is_showing:
+                    immediate_mask |= bit
+            else:
+                self._active_mask &= ~bit
+        
+        self._habit_alerting = any_habit_active
         
         # Manage outline display and messages
         if any_habit_active:
@@ -655,34 +828,27 @@ class ScreenOverlay:
             self.last_detection_time = current_time
             
             # Determine which alert level to show based on escalation timing
-            if self.is_showing and self.current_color == "red" and self.is_tinted == True and self.audio_initialized:
-                # Check if tint has been showing long enough to play alarm
-                if current_time - self.tint_start_time >= self.escalation_threshold:
+            if self.is_showing and self.current_color == "red" and self.is_tinted and self.sound_path:
+                # The escalation timer flags when the tint has been showing long enough to play the alarm
+                if self._tint_escalated and not self.audio_playing:
                     self.start_alarm()
-            elif self.is_showing and self.current_color == "red" and self.is_tinted == False:
-                # Check if red outline has been showing long enough to add tint
-                if current_time - self.red_outline_start_time >= self.escalation_threshold:
-                    self.show_tint()
-            elif self.is_showing and self.current_color == "orange":
-                # Check if orange outline has been showing long enough to turn red
-                if current_time - self.orange_outline_start_time >= self.escalation_threshold:
-                    self.show_outline("red")
+            elif self.is_showing and self.current_color in ("orange", "red"):
+                # Turn orange to red or add the tint to red once the escalation timer has flagged the current color
+                if self._outline_escalated:
+                    self._escalate_outline()
             elif not self.is_showing:
                 # Initial detection - show orange outline
                 self.show_outline("orange")
             
             # Update message
-            self.message_text = "\n".join(messages)
-            self.update_message(self.message_text)
+            self._set_message(self._message_table[message_mask])
         else:
             # If outline is showing and we have immediate messages, display them
-            if self.is_showing and immediate_messages:
-                self.message_text = "\n".join(immediate_messages)
-                self.update_message(self.message_text)
+            if self.is_showing and immediate_mask:
+                self._set_message(self._message_table[immediate_mask])
             # Otherwise, clear message if no habits are active and no immediate messages
-            elif self.message_text and not immediate_messages:
-                self.message_text = ""
-                self.update_message(self.message_text)
+            elif self.message_text and not immediate_mask:
+                self._set_message("")
             
             # If any habit is currently detected, keep the outline visible and reset the last detection time
             if any_habit_detected and self.is_showing:
@@ -698,40 +864,39 @@ class ScreenOverlay:
                 self.green_feedback_active = True
                 self.green_start_time = current_time
                 # Don't show notification for green feedback
-                if self.notification_window and self.notification_visible:
-                    self.notification_window.withdraw()
-                    self.notification_visible = False
+                if self.notification_visible:
+                    self.hide_notification()
     
-    def _check_shutdown(self):
-        """Check if shutdown was requested and schedule next check"""
-        if self.shutdown_requested:
-            # Call destroy_root which will handle the shutdown safely
-            self._destroy_root()
-            return  # Don't schedule another check
-        else:
-            # Schedule next check
-            if self.root:
-                self.root.after(100, self._check_shutdown)
+    def shutdown(self):
+        """Request the overlay windows to close and the tkinter loop to stop (safe to call from any thread)"""
+        if self.shutdown_event.is_set():
+            return
+        self.shutdown_event.set()
+        
+        # Schedule destroy_root on the Tk thread, which will handle the shutdown safely
+        if self.root:
+            self.root.after_idle(self._destroy_root)
     
     def _destroy_root(self):
         """Safely destroy the root window from the main thread"""
         try:
-            # Stop audio if it's playing
+            # Stop audio if it's playing, and make sure a pending escalation can't start it again
+            self._cancel_tint_escalation()
             if self.audio_playing:
                 self.stop_alarm()
             
             # Hide all windows first
             for window in self.windows:
                 if window.winfo_exists():
-                    window.withdraw()
+                    self._ensure_hidden(window)
             
             # Hide notification window if it exists
             if self.notification_window and self.notification_window.winfo_exists():
-                self.notification_window.withdraw()
+                self._ensure_hidden(self.notification_window)
             
             # Hide tint window if it exists
             if self.tint_window and self.tint_window.winfo_exists():
-                self.tint_window.withdraw()
+                self._ensure_hidden(self.tint_window)
             
             # Schedule actual destruction after a short delay
             # This gives time for any pending operations to complete
@@ -747,6 +912,7 @@ class ScreenOverlay:
                 pygame.mixer.quit()
                 self.audio_initialized = False
                 self.alarm_sound = None
+                self._alarm_channel = None
             
             # Destroy all windows
             for window in self.windows:
@@ -758,6 +924,8 @@ class ScreenOverlay:
             if self.notification_window and self.notification_window.winfo_exists():
                 self.notification_window.destroy()
                 self.notification_window = None
+            # Release the background images while still on the Tk thread
+            self._notification_bg_images.clear()
             
             # Destroy tint window if it exists
             if self.tint_window and self.tint_window.winfo_exists():